@@ -13,14 +13,26 @@ This allows users to perform actions such as:
 To use the CLI, you would typically run this script from your terminal,
 e.g., `python -m sonitas <command> [args...]`.
 """
-import wave
+import os
 from pathlib import Path
 from typing import Optional, List
 
 from sonitas import const, exc
-from sonitas.pyaudiof import PyAudioRecorder, PyAudioDeviceManager
-from sonitas.recorder import Recording
-from sonitas.similarity import transform, flow, SUPPORTED_SCORING, DEFAULT_SCORING
+
+# Heavy dependencies (NumPy/SciPy, the PyAudio extension) are imported inside
+# the commands that need them, so `list` or `--help` do not pay for them.
+
+# Order in which the switchable, parameterless transformers of `compare_files`
+# are applied. Names are keys of `sonitas.similarity.SUPPORTED_TRANSFORMER`;
+# the low-pass filter is appended last as it takes a parameter.
+_TRANSFORM_ORDER = ('mixdown', 'normalize', 'pad', 'fft', 'magnitude')
+
+
+def _same_file(file_path1: str, file_path2: str) -> bool:
+    """Checks whether two paths refer to the same existing file (e.g. via a link)."""
+    if not (os.path.isfile(file_path1) and os.path.isfile(file_path2)):
+        return False
+    return os.path.samefile(file_path1, file_path2)
 
 
 class Entrypoint:
@@ -41,7 +53,7 @@ class Entrypoint:
             fft: bool = True,
             magnitude: bool = True,
             lowpass: float = 0.1,
-            scoring: str = DEFAULT_SCORING,
+            scoring: str = const.CONST_DEFAULT_SCORING,
             verbose: bool = False
     ) -> None:
         """
@@ -50,6 +62,7 @@ class Entrypoint:
         The comparison involves loading the audio signals, applying selected
         transformations (mixdown, normalization, padding, FFT, magnitude, low-pass filter),
         and then calculating a similarity score using the specified scoring algorithm.
+        Two paths to the same file are read and transformed only once.
 
         Args:
             file_path1 (str): Path to the first WAV file.
@@ -63,8 +76,15 @@ class Entrypoint:
                              A value of 0.0 effectively disables the low-pass filter
                              if it's the only transformation affecting frequency content.
                              If 0, the lowpass step is skipped. Defaults to 0.1.
+                             With `fft`, the ratio applies to the one-sided
+                             spectrum of 0 Hz up to the Nyquist frequency, so
+                             0.1 keeps the lowest 10 % of that band. Versions
+                             that used a two-sided spectrum kept 20 % for the
+                             same value, so scores differ from theirs.
             scoring (str): The scoring algorithm to use (e.g., 'cosine', 'pearson').
-                           Defaults to the `DEFAULT_SCORING` value.
+                           Defaults to `sonitas.const.CONST_DEFAULT_SCORING` ('cosine').
+                           Cosine, Pearson and NCC compare in single precision, so
+                           scores may differ from earlier versions in the last digits.
             verbose (bool): If True, print details about the transformers and scorer used.
                             Defaults to False.
 
@@ -74,13 +94,28 @@ class Entrypoint:
             ValueError: If an invalid `scoring` method is provided or if transformation
                         parameters are invalid (e.g., `lowpass` out of range).
         """
+        import wave  # pylint: disable=import-outside-toplevel
+        from sonitas.recorder import Recording  # pylint: disable=import-outside-toplevel
+        from sonitas.similarity import (  # pylint: disable=import-outside-toplevel
+            transform, flow, SUPPORTED_SCORING, SUPPORTED_TRANSFORMER
+        )
+
         if scoring not in SUPPORTED_SCORING:
             print(f"Scoring '{scoring}' not supported. Available: {list(SUPPORTED_SCORING.keys())}")
             return
 
         try:
-            signal_a = Recording.from_wav(Path(file_path1)).signal()
-            signal_b = Recording.from_wav(Path(file_path2)).signal()
+            if _same_file(file_path1, file_path2):
+                # Loaded and transformed once (`Flow.run` gets the same signal
+                # twice); the pipeline still decides the score, e.g. silent
+                # input has no direction and scores 0.0
+                if verbose:
+                    print("Info: Both paths refer to the same file.")
+                recording_a = recording_b = Recording.from_wav(Path(file_path1))
+            else:
+                # Load both files concurrently to overlap their I/O
+                recording_a, recording_b = Recording.from_wavs([Path(file_path1), Path(file_path2)])
+            signal_a, signal_b = recording_a.signal(), recording_b.signal()
         except FileNotFoundError as e:
             print(f"Error: {e}")
             return
@@ -88,17 +123,10 @@ class Entrypoint:
             print(f"Error processing WAV file: {e}")
             return
 
-        transformer_steps: List[transform.Transformer] = []
-        if mixdown:
-            transformer_steps.append(transform.Mixdown())
-        if normalize:
-            transformer_steps.append(transform.Normalize())
-        if pad:
-            transformer_steps.append(transform.PadZero())
-        if fft:
-            transformer_steps.append(transform.FFT())
-        if magnitude:
-            transformer_steps.append(transform.Magnitude())
+        flags = {'mixdown': mixdown, 'normalize': normalize, 'pad': pad, 'fft': fft, 'magnitude': magnitude}
+        transformer_steps: List[transform.Transformer] = [
+            SUPPORTED_TRANSFORMER[name]() for name in _TRANSFORM_ORDER if flags[name]
+        ]
         if lowpass > 0.0:  # Only add lowpass if keep_ratio is meaningful
             try:
                 transformer_steps.append(transform.LowPass(keep_ratio=lowpass))
@@ -138,8 +166,13 @@ class Entrypoint:
             include_output (bool): If True, include output devices in the list.
                                    Defaults to True.
         """
+        from sonitas.pyaudiof import PyAudioDeviceManager  # pylint: disable=import-outside-toplevel
+
         manager = PyAudioDeviceManager()
-        devices = manager.list(include_input=include_input, include_output=include_output)
+        try:
+            devices = manager.list(include_input=include_input, include_output=include_output)
+        finally:
+            manager.close()
         if devices:
             print("Available audio devices:")
             for device in devices:
@@ -167,20 +200,32 @@ class Entrypoint:
             duration (int): The duration of the recording in seconds.
                             Defaults to `sonitas.const.CONST_DEFAULT_RECORD_DURATION` (3 seconds).
         """
+        from sonitas.pyaudiof import PyAudioRecorder, PyAudioDeviceManager  # pylint: disable=import-outside-toplevel
+
         output_path = Path(file_path)
         try:
             recorder = PyAudioRecorder(device_index=device_index)
-            print(f"Input device selected: {recorder.current_input_device}")
-            input(f"Press Enter to start recording for {duration} seconds...")
-            print("Recording...")
-            recording = recorder.record(duration)
+            try:
+                print(f"Input device selected: {recorder.current_input_device}")
+                input(f"Press Enter to start recording for {duration} seconds...")
+                print("Recording...")
+                recording = recorder.record(duration)
+            finally:
+                recorder.close()
             recording.to_wav(output_path)
             print(f"Recording complete. Wave file written to {output_path} @ {recording.frame_rate} Hz")
         except (exc.InvalidDeviceError, exc.NoInputDeviceError) as derr:
             print(f"Error: {derr}")
             print("\nPlease check your audio device configuration.")
             print("Available input devices:")
-            available_devices = PyAudioDeviceManager().list(include_output=False)
+            # Only enumerated on this error path; the PyAudio instance is shared
+            manager = PyAudioDeviceManager()
+            try:
+                available_devices = manager.list(include_output=False)
+            finally:
+                manager.close()
+            for device in available_devices:
+                print(device)
             if not available_devices:
                 print("No input devices found.")
         except KeyboardInterrupt:
@@ -10,3 +10,7 @@ place.
 # Default duration in seconds for audio recordings if no specific duration
 # is provided by the user or calling function.
 CONST_DEFAULT_RECORD_DURATION = 3
+
+# Name of the scoring algorithm used to compare signals if none is
+# explicitly requested. Must be a key of `sonitas.similarity.SUPPORTED_SCORING`.
+CONST_DEFAULT_SCORING = 'cosine'
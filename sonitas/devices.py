@@ -7,25 +7,31 @@ interface for managing them. It's designed to allow different audio backends
 way to list and select audio devices.
 
 Key Components:
-- `AudioDevice`: A Pydantic BaseModel that encapsulates information about a
+- `AudioDevice`: An immutable dataclass that encapsulates information about a
   single audio device, such as its index, name, sample rate, and channel capabilities.
 - `AudioDeviceManager`: An abstract base class defining the essential methods
   that any audio device management implementation should provide, such as
   listing available devices and selecting a default input device.
 """
 from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel
+from sonitas.frozen import cached_slot, reduce_by_fields
 
 
-class AudioDevice(BaseModel):
+@dataclass(frozen=True)
+class AudioDevice:
     """
     Represents a single audio input or output device.
 
     This class acts as a data container for device-specific information,
     making it easier to pass around and inspect device properties.
     The `__str__` method provides a human-readable summary of the device.
+    Instances are immutable, which allows the summary to be computed once.
+
+    The fields are not validated; callers are responsible for passing
+    values of the annotated types.
 
     Attributes:
         index (int): The system-specific index of the audio device.
@@ -37,12 +43,21 @@ class AudioDevice(BaseModel):
         max_output_channels (int): The maximum number of output channels supported
                                    by this device. Will be 0 if it's not an output device.
     """
+    # See `sonitas.frozen` on slots and caching; `_as_str` holds the summary
+    # once computed.
+    __slots__ = (
+        'index', 'name', 'default_sample_rate', 'max_input_channels', 'max_output_channels', '_as_str'
+    )
+
     index: int
     name: str
     default_sample_rate: int
     max_input_channels: int
     max_output_channels: int
 
+    __reduce__ = reduce_by_fields
+
+    @cached_slot('_as_str')
     def __str__(self) -> str:
         """
         Provides a string representation of the AudioDevice instance.
@@ -104,3 +119,18 @@ class AudioDeviceManager(metaclass=ABCMeta):
             are False.
         """
         raise NotImplementedError("Subclasses must implement list.")
+
+    def get_by_index(self, index: int) -> Optional[AudioDevice]:
+        """
+        Looks up a device (input or output) by its index.
+
+        This default implementation scans `list()`; implementations that
+        cache their devices can override it with a direct lookup.
+
+        Args:
+            index (int): The system-specific index of the device.
+
+        Returns:
+            The `AudioDevice` with the given index, or `None` if there is none.
+        """
+        return next((device for device in self.list() if device.index == index), None)
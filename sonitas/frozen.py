@@ -0,0 +1,54 @@
+"""
+Helpers for Immutable Dataclasses.
+
+Sonitas models plain data (e.g. `AudioDevice`, `Recording`) as frozen
+dataclasses with explicit `__slots__`; `dataclass(slots=True)` would need
+Python 3.10. Being immutable, their derived values can be computed once and
+kept in extra slots. Two things need care, and are handled here:
+
+- The frozen check rejects every attribute assignment, so caches are written
+  with `object.__setattr__` (see `cached_slot`).
+- Copying and pickling restore slotted instances attribute by attribute, which
+  the frozen check rejects as well; instances are rebuilt through `__init__`
+  from their fields instead, dropping the caches (see `reduce_by_fields`).
+"""
+import functools
+from dataclasses import fields
+from typing import Any, Callable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def cached_slot(slot: str) -> Callable[[Callable[[Any], T]], Callable[[Any], T]]:
+    """
+    Caches the result of a parameterless method in the given slot.
+
+    The method runs on the first call only; later calls return the value
+    stored in `slot`. Stack it below `@property` for cached properties.
+
+    Args:
+        slot: The name of the slot holding the cached value.
+
+    Returns:
+        A decorator for the method.
+    """
+    def decorator(method: Callable[[Any], T]) -> Callable[[Any], T]:
+        @functools.wraps(method)
+        def wrapper(self: Any) -> T:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                value = method(self)
+                object.__setattr__(self, slot, value)  # Bypass the frozen check
+                return value
+        return wrapper
+    return decorator
+
+
+def reduce_by_fields(self: Any) -> Tuple[type, Tuple[Any, ...]]:
+    """
+    Implements `__reduce__` by rebuilding an instance from its dataclass fields.
+
+    Assign it as `__reduce__ = reduce_by_fields` in the class body.
+    """
+    return type(self), tuple(getattr(self, field.name) for field in fields(self))
@@ -8,11 +8,30 @@ functionalities offered by PyAudio for audio recording and device management.
 
 This `__init__.py` file makes the primary classes of this subpackage,
 `PyAudioRecorder` and `PyAudioDeviceManager`, directly importable from
-`sonitas.pyaudiof`.
+`sonitas.pyaudiof`. They are imported lazily on first access: the recorder
+pulls in NumPy (via `sonitas.recorder`), which listing devices does not need.
 """
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .recorder import PyAudioRecorder
+    from .manager import PyAudioDeviceManager
+
+# Submodule defining each lazily exported name.
+_EXPORTS = {
+    'PyAudioRecorder': '.recorder',
+    'PyAudioDeviceManager': '.manager',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Later lookups do not go through __getattr__
+    return value
 
-from .recorder import PyAudioRecorder
-from .manager import PyAudioDeviceManager
 
 # The `__all__` list defines the public API of this package.
 # When a client executes `from sonitas.pyaudiof import *`, only the names
@@ -7,7 +7,9 @@ devices and selecting a default input device by interacting with PyAudio's
 APIs.
 """
 
-from typing import Mapping, Union, List, Optional
+import atexit
+import threading
+from typing import Dict, Mapping, Union, List, Optional
 
 import pyaudio
 
@@ -15,6 +17,35 @@ from sonitas.devices import AudioDeviceManager, AudioDevice
 from sonitas.pyaudiof import const as paconst
 
 
+# The process-wide PyAudio instance, or None while there is none (see `_shared_pa`).
+_SHARED_PA: Optional[pyaudio.PyAudio] = None
+
+
+def _shared_pa() -> pyaudio.PyAudio:
+    """
+    Returns the process-wide PyAudio instance.
+
+    Initializing PyAudio spins up PortAudio and enumerates the host audio
+    system, so it is done once on first use and shared afterwards. The
+    instance is terminated when the interpreter exits.
+    """
+    global _SHARED_PA  # pylint: disable=global-statement
+    if _SHARED_PA is None:
+        _SHARED_PA = pyaudio.PyAudio()
+        atexit.register(_SHARED_PA.terminate)
+    return _SHARED_PA
+
+
+def _terminate_shared_pa() -> None:
+    """Terminates the shared PyAudio instance; the next use creates a fresh one."""
+    global _SHARED_PA  # pylint: disable=global-statement
+    if _SHARED_PA is None:
+        return  # Not created (yet), nothing to terminate
+    old_pa, _SHARED_PA = _SHARED_PA, None
+    atexit.unregister(old_pa.terminate)
+    old_pa.terminate()
+
+
 class PyAudioDeviceManager(AudioDeviceManager):
     """
     Concrete implementation of the `AudioDeviceManager` using PyAudio.
@@ -23,27 +54,76 @@ class PyAudioDeviceManager(AudioDeviceManager):
     by wrapping PyAudio functionalities. It's responsible for translating
     PyAudio's device information into the `AudioDevice` model used
     within the Sonitas library.
+
+    The manager is a process-wide singleton: every `PyAudioDeviceManager()`
+    returns the same instance, so all recorders share one device list. Each
+    construction takes a reference that can be given back with `close`.
     """
 
-    def __init__(self):
+    _instance: Optional['PyAudioDeviceManager'] = None
+    _refcount: int = 0
+    _lock = threading.Lock()
+
+    # PyAudio calls go through the shared `pyaudio.PyAudio` instance (see
+    # `pa`). The device list is enumerated on first use and cached afterwards.
+    _cache: Optional[List[AudioDevice]] = None
+    _by_index: Optional[Dict[int, AudioDevice]] = None
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            cls._refcount += 1
+            return cls._instance
+
+    def close(self) -> None:
         """
-        Initializes the PyAudioDeviceManager.
+        Gives back the reference taken by constructing the manager.
 
-        This creates an instance of `pyaudio.PyAudio`, which is the main
-        entry point for using PyAudio's functionalities. This instance
-        will be used for all subsequent PyAudio calls.
+        When the last reference is given back, the shared PyAudio instance is
+        terminated and the singleton is discarded; a later construction starts
+        from scratch. Without `close` the PyAudio instance lives until exit.
+        Closing more often than constructing has no effect.
         """
-        self._pa = pyaudio.PyAudio()
+        with PyAudioDeviceManager._lock:
+            if PyAudioDeviceManager._instance is not self or PyAudioDeviceManager._refcount <= 0:
+                return
+            PyAudioDeviceManager._refcount -= 1
+            if PyAudioDeviceManager._refcount > 0:
+                return
+            PyAudioDeviceManager._instance = None
+            self._cache = None
+            self._by_index = None
+            _terminate_shared_pa()
+
+    @property
+    def pa(self) -> pyaudio.PyAudio:
+        """
+        The shared `pyaudio.PyAudio` instance, which is the main entry point
+        for using PyAudio's functionalities. It is created on first use, reused
+        by all managers and terminated at exit.
+        """
+        return _shared_pa()
 
-    def __del__(self):
+    def refresh(self) -> None:
         """
-        Cleans up the PyAudio instance when the manager is deleted.
+        Discards the cached device list, so devices are enumerated again.
 
-        It's important to terminate the PyAudio instance to release
-        system resources.
+        PortAudio only scans the host audio system when it is initialized,
+        therefore the shared PyAudio instance is replaced by a fresh one.
+        This must not be called while streams of the old instance are open
+        (e.g. during a recording).
         """
-        if hasattr(self, '_pa') and self._pa:
-            self._pa.terminate()
+        _terminate_shared_pa()
+        self._cache = None
+        self._by_index = None
+
+    def _devices(self) -> List[AudioDevice]:
+        """Returns all devices reported by PyAudio, enumerating them on first use."""
+        if self._cache is None:
+            get_info = self.pa.get_device_info_by_index
+            self._cache = [self._to_device(i, get_info(i)) for i in range(self.pa.get_device_count())]
+        return self._cache
 
     @classmethod
     def _to_device(cls, index: int, device_info: Mapping[str, Union[str, int, float]]) -> AudioDevice:
@@ -51,7 +131,8 @@ class PyAudioDeviceManager(AudioDeviceManager):
         Parses a device information mapping from PyAudio into an `AudioDevice` instance.
 
         This helper method converts the raw dictionary returned by PyAudio for a
-        device into the structured `AudioDevice` Pydantic model.
+        device into the structured `AudioDevice` dataclass, coercing the values
+        to the expected types.
 
         Args:
             index: The numerical index of the device as provided by PyAudio.
@@ -63,12 +144,29 @@ class PyAudioDeviceManager(AudioDeviceManager):
         """
         return AudioDevice(
             index=int(index),
-            name=str(device_info.get(paconst.CONST_DEVICE_NAME, 0)),
-            default_sample_rate=int(device_info.get(paconst.CONST_DEVICE_DEFAULT_SAMPLE_RATE, 0)),
-            max_input_channels=int(device_info.get(paconst.CONST_DEVICE_MAX_INPUT_CHANNELS, 0)),
-            max_output_channels=int(device_info.get(paconst.CONST_DEVICE_MAX_OUTPUT_CHANNELS, 0)),
+            name=str(device_info.get(paconst.CONST_DEVICE_NAME, '')),
+            default_sample_rate=int(device_info.get(paconst.CONST_DEVICE_DEFAULT_SAMPLE_RATE, 0) or 0),
+            max_input_channels=int(device_info.get(paconst.CONST_DEVICE_MAX_INPUT_CHANNELS, 0) or 0),
+            max_output_channels=int(device_info.get(paconst.CONST_DEVICE_MAX_OUTPUT_CHANNELS, 0) or 0),
         )
 
+    def get_by_index(self, index: int) -> Optional[AudioDevice]:
+        """
+        Looks up a device (input or output) by its PyAudio index.
+
+        The index is built alongside the cached device list, so this is a
+        dictionary lookup instead of a scan over all devices.
+
+        Args:
+            index: The numerical index of the device as provided by PyAudio.
+
+        Returns:
+            The `AudioDevice` with the given index, or `None` if there is none.
+        """
+        if self._by_index is None:
+            self._by_index = {device.index: device for device in self._devices()}
+        return self._by_index.get(index)
+
     def select_default_input(self) -> Optional[AudioDevice]:
         """
         Selects and returns the system's default audio input device as reported by PyAudio.
@@ -89,9 +187,9 @@ class PyAudioDeviceManager(AudioDeviceManager):
         """
         Lists all available audio devices, with options to filter by type (input/output).
 
-        It iterates through all devices reported by PyAudio, converts them to
-        `AudioDevice` objects, and filters them based on their capabilities
-        and the provided flags.
+        It filters all devices reported by PyAudio based on their capabilities
+        and the provided flags. The devices are enumerated once and cached;
+        call `refresh` to pick up devices that were added or removed since.
 
         Args:
             include_input: If True, input-capable devices will be included.
@@ -103,13 +201,9 @@ class PyAudioDeviceManager(AudioDeviceManager):
             `include_input` and `include_output` are False (though the latter
             case would mean no devices match the filter).
         """
-        res = []
-        for i in range(self._pa.get_device_count()):
-            dev = self._pa.get_device_info_by_index(i)
-            device = self._to_device(i, dev)
-            if include_input and device.max_input_channels > 0:
-                res.append(device)
-            if include_output and device.max_output_channels > 0:
-                res.append(device)
-
-        return res
+        # A duplex device matches both filters but is listed only once
+        return [
+            device for device in self._devices()
+            if (include_input and device.max_input_channels > 0)
+            or (include_output and device.max_output_channels > 0)
+        ]
@@ -6,6 +6,7 @@ library to capture audio from a specified or default input device.
 It conforms to the `Recorder` interface defined in `sonitas.recorder`.
 """
 
+import threading
 from typing import Optional
 
 import pyaudio
@@ -15,6 +16,9 @@ from sonitas.devices import AudioDevice
 from sonitas.recorder import Recorder, Recording
 from .manager import PyAudioDeviceManager
 
+# Size in bytes of the 16-bit samples the recorder captures.
+_INT16_SAMPLE_SIZE = pyaudio.get_sample_size(pyaudio.paInt16)
+
 
 class PyAudioRecorder(Recorder):
     """
@@ -29,9 +33,10 @@ class PyAudioRecorder(Recorder):
     DEFAULT_CHANNELS = 1
     DEFAULT_RATE = 24000
     DEFAULT_CHUNK = 1024
+    POLL_INTERVAL = 0.1  # Seconds between checks whether the stream is still alive
 
     def __init__(
-            self, device_index: Optional[int] = None
+            self, device_index: Optional[int] = None, chunk_frames: Optional[int] = None
     ):
         """
         Initializes the PyAudioRecorder.
@@ -43,9 +48,37 @@ class PyAudioRecorder(Recorder):
         Args:
             device_index (Optional[int]): The index of the PyAudio input device.
                                           If None, the default input device is used.
+            chunk_frames (Optional[int]): The number of frames PortAudio hands over
+                                          per callback. Larger chunks mean fewer
+                                          Python round-trips, smaller chunks a lower
+                                          latency. If None, chunks of 100 ms (but at
+                                          least `DEFAULT_CHUNK` frames) are used.
+
+        Raises:
+            ValueError: If `chunk_frames` is not positive.
         """
+        if chunk_frames is not None and chunk_frames <= 0:
+            raise ValueError(f"`chunk_frames` must be positive, got {chunk_frames}.")
+        self.chunk_frames = chunk_frames
         self.device_manager = PyAudioDeviceManager()
-        self._device = self._select_device(device_index)
+        try:
+            self._device = self._select_device(device_index)
+        except Exception:
+            self.device_manager.close()
+            raise
+        self._closed = False
+
+    def close(self) -> None:
+        """
+        Releases the recorder's reference to the shared device manager.
+
+        Once the last recorder (or other user) is closed, the shared PyAudio
+        instance is terminated. The recorder must not be used afterwards;
+        closing it again has no effect.
+        """
+        if not self._closed:
+            self._closed = True
+            self.device_manager.close()
 
     @property
     def current_input_device(self) -> AudioDevice:
@@ -83,8 +116,7 @@ class PyAudioRecorder(Recorder):
                 raise exc.NoInputDeviceError("No available input device found.")
             return device
 
-        devices = self.device_manager.list()
-        device = next((d for d in devices if d.index == index), None)
+        device = self.device_manager.get_by_index(index)
         if not device:
             raise exc.InvalidDeviceError(f"Invalid device index: {index}.")
 
@@ -93,16 +125,19 @@ class PyAudioRecorder(Recorder):
 
         return device
 
-    def record(self, duration: int) -> Recording:
+    def record(self, duration: float) -> Recording:
         """
         Records audio from the selected input device for a specified duration.
 
-        This method opens an audio stream using PyAudio, reads data in chunks,
-        and then compiles it into a `Recording` object. Resources (stream and
-        PyAudio instance) are cleaned up automatically.
+        This method opens an audio stream in callback mode on the device manager's
+        shared PyAudio instance. PortAudio delivers the audio in chunks, which are
+        copied into a buffer preallocated for `duration` seconds. That buffer
+        becomes the frames of the resulting `Recording` without another copy.
+        The stream is closed automatically. If the stream stops early, the
+        audio captured so far is returned.
 
         Args:
-            duration (int): The duration of the recording in seconds.
+            duration (float): The duration of the recording in seconds.
 
         Returns:
             Recording: An object containing the recorded audio frames, number of
@@ -115,7 +150,8 @@ class PyAudioRecorder(Recorder):
         """
         channels = self._device.max_input_channels
         rate = self._device.default_sample_rate
-        chunk_size = self.DEFAULT_CHUNK
+        # Callbacks every ~100 ms amortize the interpreter overhead per chunk
+        chunk_size = self.chunk_frames or max(self.DEFAULT_CHUNK, rate // 10)
 
         # Validate that the selected device actually has input channels and a valid sample rate
         if channels <= 0:
@@ -125,29 +161,49 @@ class PyAudioRecorder(Recorder):
                 f"Selected device '{self._device.name}' has an invalid default sample rate: {rate} Hz."
             )
 
-        pa = pyaudio.PyAudio()
-        stream = pa.open(
+        # PortAudio's audio thread copies each chunk straight into a buffer
+        # sized for the whole recording; this thread only waits for it to fill.
+        n_frames = int(rate * duration)  # The duration need not be whole seconds
+        buffer = bytearray(n_frames * channels * _INT16_SAMPLE_SIZE)
+        view = memoryview(buffer)
+        written = 0
+        done = threading.Event()
+
+        def on_chunk(in_data, frame_count, time_info, status_flags):  # pylint: disable=unused-argument
+            nonlocal written
+            size = min(len(in_data), len(buffer) - written)
+            view[written:written + size] = in_data[:size]
+            written += size
+            if written >= len(buffer):
+                done.set()
+                return None, pyaudio.paComplete
+            return None, pyaudio.paContinue
+
+        # Reuse the manager's PyAudio instance instead of initializing PortAudio again
+        stream = self.device_manager.pa.open(
             format=pyaudio.paInt16,
             channels=channels,
             rate=rate,
             input=True,
             input_device_index=self._device.index,
-            frames_per_buffer=chunk_size
+            frames_per_buffer=chunk_size,
+            stream_callback=on_chunk
         )
 
         try:
-            frames = []
-            for _ in range(0, int(rate / chunk_size * duration)):
-                data = stream.read(chunk_size)
-                frames.append(data)
+            # Poll for the stream dying early (e.g. the device got disconnected)
+            while not done.wait(self.POLL_INTERVAL) and stream.is_active():
+                pass
         finally:
             stream.stop_stream()
             stream.close()
-            pa.terminate()
 
+        view.release()
+        # The full buffer becomes the frames as is (`Recording` accepts any
+        # bytes-like object); only a recording that stopped early is copied.
         return Recording(
-            frames=b''.join(frames),
+            frames=buffer if written == len(buffer) else bytes(buffer[:written]),
             channels=channels,
-            sample_size=pa.get_sample_size(pyaudio.paInt16),
+            sample_size=_INT16_SAMPLE_SIZE,
             frame_rate=rate
         )
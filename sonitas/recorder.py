@@ -5,7 +5,7 @@ This module provides classes for managing audio recordings and defining
 an interface for audio recording devices.
 
 Key Components:
-- `Recording`: A Pydantic BaseModel that encapsulates raw audio frames and
+- `Recording`: An immutable dataclass that encapsulates raw audio frames and
   metadata (channels, sample size, frame rate). It includes methods for
   loading from WAV files, calculating duration, converting to a numerical
   signal (NumPy array), and saving back to a WAV file.
@@ -14,19 +14,180 @@ Key Components:
   accessing the current input device and initiating a recording.
 """
 
+import mmap
+import os
+import struct
 import wave
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from pydantic import BaseModel, Field
 
 from sonitas.devices import AudioDevice
-from sonitas.typestore import Signal
+from sonitas.frozen import cached_slot, reduce_by_fields
+from sonitas.typestore import Float32Signal, Signal
+
+# WAVE format tags accepted by the RIFF parser: plain integer PCM and the
+# extensible variant (which carries PCM data behind a longer fmt chunk).
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Precompiled (un)packers for the RIFF header ('RIFF', size, 'WAVE'), the chunk
+# headers (id, size) and the leading fields of the fmt chunk (format tag,
+# channels, frame rate, byte rate, block align, bits per sample).
+_RIFF_HEADER = struct.Struct('<4sI4s')
+_CHUNK_HEADER = struct.Struct('<4sI')
+_FMT_CHUNK = struct.Struct('<HHIIHH')
+
+# The extension of an extensible fmt chunk (extension size, valid bits per
+# sample, channel mask, SubFormat GUID); only the integer PCM GUID is accepted.
+_FMT_EXTENSIBLE = struct.Struct('<HHI16s')
+_KSDATAFORMAT_SUBTYPE_PCM = b'\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+# NumPy dtype of the decoded samples, indexed by the sample size in bytes.
+_DTYPE_BY_SIZE = (
+    None,
+    np.uint8,  # 8-bit PCM (unsigned)
+    np.int16,  # 16-bit PCM (signed)
+    np.int32,  # 24-bit PCM, unpacked into 32-bit containers
+    np.int32,  # 32-bit PCM
+)
+
+# Magnitude of the most negative sample by the sample size in bytes; decoded
+# samples divided by it lie within [-1.0, 1.0).
+_FULL_SCALE_BY_SIZE: Dict[int, int] = {1: 1 << 7, 2: 1 << 15, 3: 1 << 23, 4: 1 << 31}
+
+
+def _check_extensible_pcm(buffer: mmap.mmap, offset: int, chunk_size: int) -> None:
+    """
+    Checks that an extensible fmt chunk, starting at `offset`, describes integer PCM.
+
+    Raises:
+        wave.Error: If the chunk is too short or its SubFormat is not PCM
+                    (e.g. IEEE float samples, which must not be decoded as integers).
+    """
+    ext_offset = offset + _FMT_CHUNK.size
+    if chunk_size < _FMT_CHUNK.size + _FMT_EXTENSIBLE.size or ext_offset + _FMT_EXTENSIBLE.size > len(buffer):
+        raise wave.Error('fmt chunk too short')
+    if _FMT_EXTENSIBLE.unpack_from(buffer, ext_offset)[3] != _KSDATAFORMAT_SUBTYPE_PCM:
+        raise wave.Error('unknown extended format')
+
+
+def _parse_wav_header(buffer: mmap.mmap) -> Tuple[int, int, int, int, int]:
+    """
+    Walks the RIFF chunks of an in-memory WAV file.
+
+    Unknown chunks (e.g. `LIST`, `JUNK`) and fmt chunk extensions are skipped,
+    so only the `fmt ` and `data` chunks are interpreted. Of an extensible fmt
+    chunk, only the SubFormat is checked to be integer PCM.
+
+    Args:
+        buffer: The complete WAV file contents.
 
+    Returns:
+        A tuple of (channels, sample_size, frame_rate, data_offset, data_size).
 
-class Recording(BaseModel):
+    Raises:
+        wave.Error: If the buffer is not a PCM WAVE file.
+    """
+    if len(buffer) < _RIFF_HEADER.size:
+        raise wave.Error('file does not start with RIFF id')
+    riff, _, wave_id = _RIFF_HEADER.unpack_from(buffer, 0)
+    if riff != b'RIFF':
+        raise wave.Error('file does not start with RIFF id')
+    if wave_id != b'WAVE':
+        raise wave.Error('not a WAVE file')
+
+    fmt = None
+    offset = _RIFF_HEADER.size
+    while offset + _CHUNK_HEADER.size <= len(buffer):
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(buffer, offset)
+        offset += _CHUNK_HEADER.size
+        if chunk_id == b'fmt ':
+            if chunk_size < _FMT_CHUNK.size or offset + _FMT_CHUNK.size > len(buffer):
+                raise wave.Error('fmt chunk too short')
+            format_tag, channels, frame_rate, _, _, bits = _FMT_CHUNK.unpack_from(buffer, offset)
+            if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE):
+                raise wave.Error(f'unknown format: {format_tag}')
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE:
+                _check_extensible_pcm(buffer, offset, chunk_size)
+            fmt = (channels, (bits + 7) // 8, frame_rate)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise wave.Error('data chunk before fmt chunk')
+            # Tolerate truncated files whose header overstates the data size
+            return (*fmt, offset, min(chunk_size, len(buffer) - offset))
+        # Chunks are word aligned
+        offset += chunk_size + (chunk_size & 1)
+
+    if fmt is None:
+        raise wave.Error('fmt chunk missing')
+    raise wave.Error('data chunk missing')
+
+
+def _build_wav_header(channels: int, sample_size: int, frame_rate: int, data_size: int) -> bytes:
+    """
+    Builds the canonical 44-byte header of a PCM WAV file.
+
+    Args:
+        channels: The number of channels.
+        sample_size: The size of each sample in bytes.
+        frame_rate: The number of frames per second.
+        data_size: The size of the sample data in bytes.
+
+    Returns:
+        The RIFF header, the fmt chunk and the header of the data chunk.
+
+    Raises:
+        wave.Error: If the metadata cannot be represented in a PCM WAV file.
+    """
+    if channels < 1:
+        raise wave.Error('bad # of channels')
+    if not 1 <= sample_size <= 4:
+        raise wave.Error('bad sample width')
+    if frame_rate <= 0:
+        raise wave.Error('bad frame rate')
+
+    block_align = channels * sample_size
+    riff_size = 4 + 2 * _CHUNK_HEADER.size + _FMT_CHUNK.size + data_size + (data_size & 1)
+    return b''.join((
+        _RIFF_HEADER.pack(b'RIFF', riff_size, b'WAVE'),
+        _CHUNK_HEADER.pack(b'fmt ', _FMT_CHUNK.size),
+        _FMT_CHUNK.pack(
+            _WAVE_FORMAT_PCM, channels, frame_rate, frame_rate * block_align, block_align, sample_size * 8
+        ),
+        _CHUNK_HEADER.pack(b'data', data_size),
+    ))
+
+
+def _unpack_pcm24(frames: Union[bytes, memoryview]) -> np.ndarray:
+    """
+    Decodes packed little-endian 24-bit PCM samples into int32 values.
+
+    Each 3-byte sample is placed in the upper three bytes of a 4-byte
+    container; an arithmetic right shift by 8 then yields the sign-extended
+    value. Both steps are vectorized over the whole buffer, and the result
+    reuses the memory of the containers.
+
+    Raises:
+        ValueError: If the number of bytes is not a multiple of 3.
+    """
+    raw = np.frombuffer(frames, dtype=np.uint8)
+    if raw.size % 3:
+        raise ValueError(f"24-bit frames must be a multiple of 3 bytes, got {raw.size}")
+    containers = np.empty((raw.size // 3, 4), dtype=np.uint8)
+    containers[:, 0] = 0
+    containers[:, 1:] = raw.reshape(-1, 3)
+    samples = containers.view('<i4').reshape(-1)
+    samples >>= 8  # In place, the containers are not needed afterwards
+    return samples.astype(np.int32, copy=False)
+
+
+@dataclass(frozen=True, repr=False)
+class Recording:
     """
     Container class for an audio recording, typically from a WAV file or live input.
 
@@ -36,17 +197,47 @@ class Recording(BaseModel):
     calculate duration, and convert the raw frames into a NumPy array
     representation (Signal).
 
+    The fields are not validated or converted, so constructing a recording
+    never touches (let alone copies) the frames; callers are responsible for
+    passing values of the annotated types. As instances are immutable, the
+    signal and the duration are computed once and cached.
+
     Attributes:
-        frames (bytes): The raw audio data. Not directly shown in `repr` for brevity.
+        frames (bytes): The raw audio data, any bytes-like object (e.g. `bytearray`).
+                        Not directly shown in `repr` for brevity.
         channels (int): The number of audio channels (e.g., 1 for mono, 2 for stereo).
         sample_size (int): The size of each audio sample in bytes (e.g., 2 for 16-bit audio).
         frame_rate (int): The number of frames per second (e.g., 44100 Hz).
     """
-    frames: bytes = Field(repr=False)
+    # See `sonitas.frozen` on slots and caching; `_nbytes`, `_signal` and
+    # `_duration` hold the cached results of `nbytes`, `signal` and `duration`.
+    __slots__ = ('frames', 'channels', 'sample_size', 'frame_rate', '_nbytes', '_signal', '_duration')
+
+    frames: Union[bytes, bytearray, memoryview]
     channels: int
     sample_size: int
     frame_rate: int
 
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(channels={self.channels}, "
+            f"sample_size={self.sample_size}, frame_rate={self.frame_rate})"
+        )
+
+    __reduce__ = reduce_by_fields
+
+    @property
+    @cached_slot('_nbytes')
+    def nbytes(self) -> int:
+        """
+        The size of the raw audio data in bytes.
+
+        Unlike `len(frames)`, this is also correct for buffers whose items are
+        larger than a byte (e.g. a memoryview of an int16 array). It is
+        computed once and cached.
+        """
+        return memoryview(self.frames).nbytes
+
     @property
     def summary(self) -> str:
         """
@@ -56,7 +247,7 @@ class Recording(BaseModel):
             A string indicating the length of the frames in bytes and the
             duration of the recording in seconds.
         """
-        return f"<length {len(self.frames)}; duration {self.duration:.2f} sec>"
+        return f"<length {self.nbytes}; duration {self.duration:.2f} sec>"
 
     @classmethod
     def from_wav(cls, file_path: Union[str, Path]) -> 'Recording':
@@ -78,20 +269,60 @@ class Recording(BaseModel):
         if not file_path.exists():
             raise FileNotFoundError(f"File '{file_path}' not found.")
 
-        with wave.open(str(file_path), 'rb') as wf:
-            return cls(
-                frames=wf.readframes(wf.getnframes()),
-                channels=wf.getnchannels(),
-                sample_size=wf.getsampwidth(),
-                frame_rate=wf.getframerate()
-            )
+        # Map the whole file once and parse it from memory instead of going
+        # through the many small reads of the `wave` module.
+        fd = os.open(str(file_path), os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                raise wave.Error('file does not start with RIFF id')
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                channels, sample_size, frame_rate, data_offset, data_size = _parse_wav_header(mm)
+                frame_size = channels * sample_size
+                if frame_size:
+                    data_size -= data_size % frame_size  # Only whole frames
+                return cls(
+                    frames=mm[data_offset:data_offset + data_size],
+                    channels=channels,
+                    sample_size=sample_size,
+                    frame_rate=frame_rate
+                )
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def from_wavs(
+            cls, file_paths: Sequence[Union[str, Path]], max_workers: Optional[int] = None
+    ) -> List['Recording']:
+        """
+        Creates Recording instances for several WAV files, loading them concurrently.
+
+        The files are loaded by a thread pool, so the I/O of the individual
+        files overlaps instead of being serialized.
+
+        Args:
+            file_paths: The paths to the WAV files.
+            max_workers: The maximum number of loader threads. Defaults to
+                         the `ThreadPoolExecutor` default.
+
+        Returns:
+            The recordings, in the order of `file_paths`.
+
+        Raises:
+            FileNotFoundError: If any of the WAV files does not exist.
+            wave.Error: If any of the files is not a valid WAV file.
+        """
+        if len(file_paths) <= 1:
+            return [cls.from_wav(file_path) for file_path in file_paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.from_wav, file_paths))
 
     @property
+    @cached_slot('_duration')
     def duration(self) -> float:
         """
         Calculates and returns the duration of the recording in seconds.
 
-        The duration is derived from the total number of bytes in `frames`,
+        The duration is derived from the total number of bytes in `frames` (`nbytes`),
         the number of channels, the sample size (bytes per sample), and the
         frame rate.
 
@@ -100,49 +331,104 @@ class Recording(BaseModel):
         """
         if self.channels == 0 or self.sample_size == 0 or self.frame_rate == 0:
             return 0.0  # Avoid division by zero if metadata is invalid
+        return self.nbytes / self.channels / self.sample_size / self.frame_rate
 
-        return len(self.frames) / self.channels / self.sample_size / self.frame_rate
-
+    @cached_slot('_signal')
     def signal(self) -> Signal:
         """
         Converts the raw audio frames into a NumPy array (Signal).
 
         The method interprets the byte string `frames` based on the `sample_size`
-        to determine the correct NumPy data type. For multi-channel audio,
+        to determine the correct NumPy data type. Packed 24-bit samples are
+        sign-extended into int32 values. For multi-channel audio,
         the resulting array is reshaped to have dimensions (n_samples, n_channels).
 
+        `frames` may be any bytes-like object (`bytes`, `bytearray`, `memoryview`,
+        ...); its buffer is decoded in bulk by NumPy, never sample by sample in
+        Python. The array is built on the first call and returned by all later
+        ones. It is read-only, as it is shared (and usually a view of `frames`).
+
         Returns:
-            A NumPy array representing the audio signal. For mono audio, this is
-            a 1D array. For stereo or multi-channel audio, this is a 2D array
+            A read-only NumPy array representing the audio signal. For mono audio,
+            this is a 1D array. For stereo or multi-channel audio, this is a 2D array
             where each row is a sample and each column is a channel.
 
         Raises:
             ValueError: If the `sample_size` is unsupported or if the frames
                         cannot be correctly reshaped according to the number of channels.
+            TypeError: If `frames` does not support the buffer protocol.
         """
         # Choose correct numpy dtype based on sample width
-        dtype_map = {
-            1: np.uint8,  # 8-bit PCM (unsigned)
-            2: np.int16,  # 16-bit PCM (signed)
-            3: np.int32,  # 24-bit PCM stored as 32-bit container
-            4: np.int32,  # 32-bit PCM
-        }
-
-        dtype = dtype_map.get(self.sample_size)
+        dtype = _DTYPE_BY_SIZE[self.sample_size] if 0 < self.sample_size < len(_DTYPE_BY_SIZE) else None
         if dtype is None:
             raise ValueError(f"Unsupported sample size: {self.sample_size} bytes")
 
-        if len(self.frames) == 0:
-            return np.array([], dtype=dtype)  # Return empty array if no frames
-
-        signal = np.frombuffer(self.frames, dtype=dtype)
+        # Flat view of the raw bytes, whatever the item format of the buffer
+        frames = memoryview(self.frames).cast('B')
+        if frames.nbytes == 0:
+            signal = np.array([], dtype=dtype)  # Empty array if no frames
+        elif self.sample_size == 3:
+            signal = _unpack_pcm24(frames)
+        else:
+            signal = np.frombuffer(frames, dtype=dtype)
 
-        # Reshape based on number of channels
+        # Reshape based on number of channels (a view, no copy)
         if self.channels > 1:
             signal = signal.reshape(-1, self.channels)
 
+        signal.flags.writeable = False
         return signal
 
+    def signal_f32(self) -> Float32Signal:
+        """
+        Converts the raw audio frames into float32 samples within [-1.0, 1.0).
+
+        The samples of `signal()` are scaled by the full-scale value of their
+        sample size (8-bit PCM is unsigned and centered first). Casting and
+        scaling happen in one pass into a single float32 array, without an
+        intermediate float64 copy.
+
+        Returns:
+            A new float32 array of the same shape as `signal()`.
+
+        Raises:
+            ValueError: If the `sample_size` is unsupported (see `signal`).
+        """
+        signal = self.signal()
+        scale = np.float32(1.0 / _FULL_SCALE_BY_SIZE[self.sample_size])
+        out = np.empty(signal.shape, dtype=np.float32)
+        if self.sample_size == 1:
+            np.subtract(signal, 128, out=out, dtype=np.float32)
+            out *= scale
+        else:
+            np.multiply(signal, scale, out=out, dtype=np.float32)
+        return out
+
+    def signal_deinterleaved(self) -> Signal:
+        """
+        Converts the raw audio frames into one contiguous array per channel.
+
+        `signal()` keeps the interleaved layout of the frames, so a single
+        channel of it (a column) is a strided view. This method copies every
+        channel into its own row instead, letting per-channel processing
+        (e.g. an FFT per channel) scan memory linearly.
+
+        Returns:
+            A NumPy array of shape (n_channels, n_samples). For mono audio this
+            is a read-only view of `signal()`; otherwise it is a new array.
+
+        Raises:
+            ValueError: If the `sample_size` is unsupported (see `signal`).
+        """
+        signal = self.signal()
+        if signal.ndim == 1:
+            return signal.reshape(1, -1)
+        out = np.empty((signal.shape[1], signal.shape[0]), dtype=signal.dtype)
+        # One channel at a time: each row is written sequentially
+        for channel in range(signal.shape[1]):
+            out[channel] = signal[:, channel]
+        return out
+
     def to_wav(self, output_file: Path) -> None:
         """
         Writes the recording's audio frames to a WAV file.
@@ -154,15 +440,18 @@ class Recording(BaseModel):
         Args:
             output_file: The path where the WAV file will be saved
                          (can be a string or a Path object).
+
+        Raises:
+            wave.Error: If the metadata cannot be represented in a PCM WAV file.
         """
-        out_file = wave.open(str(output_file), 'wb')
-        try:
-            out_file.setnchannels(self.channels)
-            out_file.setsampwidth(self.sample_size)
-            out_file.setframerate(self.frame_rate)
-            out_file.writeframes(self.frames)
-        finally:
-            out_file.close()
+        header = _build_wav_header(self.channels, self.sample_size, self.frame_rate, self.nbytes)
+        with open(output_file, 'wb') as out_file:
+            # The header is final up front, so the frames go out in one write
+            # without a seek back to patch sizes in.
+            out_file.write(header)
+            out_file.write(self.frames)
+            if self.nbytes & 1:
+                out_file.write(b'\x00')  # Chunks are word aligned
 
 
 class Recorder(metaclass=ABCMeta):  # pylint: disable=too-few-public-methods
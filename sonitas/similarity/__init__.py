@@ -19,13 +19,14 @@ Attributes:
         their respective transformer class implementations from the `transform`
         module. This facilitates the creation of transformation pipelines.
 """
+from sonitas import const
 from . import scoring
 from . import transform
 
 
 # The default scoring method to be used when comparing signals if not
 # explicitly specified.
-DEFAULT_SCORING = 'cosine'
+DEFAULT_SCORING = const.CONST_DEFAULT_SCORING
 
 
 # A registry of supported scoring algorithms.
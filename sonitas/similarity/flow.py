@@ -5,11 +5,17 @@ This module provides the `Flow` class, which orchestrates a series of
 transformations on two input signals and then scores their similarity.
 It's designed to be a flexible pipeline where different transformation
 steps and scoring methods can be plugged in.
+
+Many signal pairs can be compared in parallel with `Flow.run_batch`.
 """
-from typing import List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from sonitas.similarity.scoring import Scoring
-from sonitas.similarity.transform import Transformer
+from sonitas.similarity.transform import Transformer, UnaryTransform, fuse
 from sonitas.typestore import Signal
 
 
@@ -34,6 +40,9 @@ class Flow:
         """
         self.steps = steps
         self.scoring = scoring
+        # Adjacent sample-wise steps are applied as one with a single working
+        # buffer. Built once here, so `steps` is not meant to change afterwards.
+        self._plan = fuse(steps)
 
     def run(self, signal_a: Signal, signal_b: Signal) -> float:
         """
@@ -41,7 +50,13 @@ class Flow:
 
         Each transformer in `self.steps` is applied to `signal_a` and
         `signal_b`. The transformed signals are then passed to the
-        `self.scoring` object's `compare` method.
+        `self.scoring` object's `compare` method. If both arguments are the
+        same object, it is transformed only once.
+
+        The input signals are never modified. Intermediate results do not
+        leave the pipeline though, so unary steps are allowed to overwrite
+        them (see `UnaryTransform.transform_unary_inplace`) instead of
+        allocating new arrays for every step.
 
         Args:
             signal_a: The first input signal.
@@ -52,7 +67,75 @@ class Flow:
             signals after transformation, as determined by the `scoring`
             object.
         """
-        for step in self.steps:
-            signal_a, signal_b = step.transform(signal_a, signal_b)
+        if signal_a is signal_b:
+            transformed = self._transform_identical(signal_a)
+            return self.scoring.compare(transformed, transformed)
+
+        input_a, input_b = signal_a, signal_b
+        owned = False  # Whether both signals are intermediates of the pipeline
+        for step in self._plan:
+            if owned and isinstance(step, UnaryTransform):
+                signal_a = step.transform_unary_inplace(signal_a)
+                signal_b = step.transform_unary_inplace(signal_b)
+            else:
+                signal_a, signal_b = step.transform(signal_a, signal_b)
+            # Steps may hand back (views of) their input, e.g. Mixdown for mono signals
+            owned = not (
+                np.may_share_memory(signal_a, input_a)
+                or np.may_share_memory(signal_b, input_b)
+                or np.may_share_memory(signal_a, signal_b)
+            )
 
         return self.scoring.compare(signal_a, signal_b)
+
+    def _transform_identical(self, signal: Signal) -> Signal:
+        """
+        Applies the pipeline to a signal that is compared with itself.
+
+        Both sides would go through the same steps with the same result, so
+        the steps run once; a binary step gets the signal as both arguments.
+        """
+        transformed = signal
+        owned = False  # Whether the signal is an intermediate of the pipeline
+        for step in self._plan:
+            if isinstance(step, UnaryTransform):
+                if owned:
+                    transformed = step.transform_unary_inplace(transformed)
+                else:
+                    transformed = step.transform_unary(transformed)
+            else:
+                transformed, _ = step.transform(transformed, transformed)
+            owned = not np.may_share_memory(transformed, signal)
+        return transformed
+
+    def _run_pair(self, pair: Tuple[Signal, Signal]) -> float:
+        """Runs the pipeline on a single pair (a picklable task for `run_batch`)."""
+        return self.run(*pair)
+
+    def run_batch(self, pairs: Iterable[Tuple[Signal, Signal]], workers: Optional[int] = None) -> List[float]:
+        """
+        Executes the pipeline on many signal pairs in parallel.
+
+        The pairs are independent, so they are distributed over a pool of
+        worker processes, which sidesteps the GIL. Pairs are sent to the
+        workers in chunks to amortize the cost of pickling the flow and
+        the signals.
+
+        Args:
+            pairs: The (signal_a, signal_b) pairs to compare.
+            workers: The number of worker processes. Defaults to the number
+                     of CPUs. With a single worker (or pair) the pairs are
+                     compared in the calling process.
+
+        Returns:
+            The similarity scores, in the order of `pairs`.
+        """
+        pairs = list(pairs)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(pairs) <= 1:
+            return [self.run(signal_a, signal_b) for signal_a, signal_b in pairs]
+
+        workers = min(workers, len(pairs))
+        chunksize = max(len(pairs) // (workers * 4), 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._run_pair, pairs, chunksize=chunksize))
@@ -13,13 +13,17 @@ Key components:
   signal, which can also be applied to two signals independently.
 - Concrete transformers like `Mixdown`, `Normalize`, `LowPass`, `Magnitude`,
   `PadZero`, and `FFT`.
+- `FusedTransform`: Applies a chain of fusable unary transformers to a signal
+  with a single working buffer.
+- `LowPassMagnitude`: `Magnitude` followed by `LowPass`, computing magnitudes
+  only for the kept components.
 """
 
 from abc import abstractmethod, ABCMeta
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 
 import numpy as np
-from numpy.fft import fft
+from scipy import fft as sp_fft
 
 from sonitas.typestore import Signal
 
@@ -27,6 +31,19 @@ from sonitas.typestore import Signal
 Transformer = Union['UnaryTransform', 'BinaryTransform']
 
 
+def compute_dtype(signal: Signal) -> np.dtype:
+    """
+    Returns the floating point dtype to carry out computations on a signal in.
+
+    Integer PCM samples are processed in single precision, as its 24-bit
+    significand holds up to 24-bit samples exactly. Floating point (or complex)
+    signals keep their precision.
+    """
+    if np.issubdtype(signal.dtype, np.inexact):
+        return signal.dtype
+    return np.dtype(np.float32)
+
+
 class BinaryTransform(metaclass=ABCMeta):
     """
     Abstract base class for transformations that operate on two signals simultaneously.
@@ -61,6 +78,10 @@ class UnaryTransform(BinaryTransform, metaclass=ABCMeta):
     method.
     """
 
+    # Whether the transformer works sample-wise on a signal of any length,
+    # so it can be chained into a `FusedTransform`.
+    fusable: bool = False
+
     @abstractmethod
     def transform_unary(self, signal: Signal) -> Signal:
         """
@@ -74,6 +95,22 @@ class UnaryTransform(BinaryTransform, metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def transform_unary_inplace(self, signal: Signal) -> Signal:
+        """
+        Applies the transformation to a signal the caller no longer needs.
+
+        Transformers able to reuse the memory of `signal` for their result
+        override this to avoid allocating a new array; `signal` may be
+        overwritten. By default this is the same as `transform_unary`.
+
+        Args:
+            signal: The signal to transform. Its contents may be modified.
+
+        Returns:
+            The transformed signal, possibly sharing memory with `signal`.
+        """
+        return self.transform_unary(signal)
+
     def transform(self, signal_a: Signal, signal_b: Signal) -> Tuple[Signal, Signal]:
         """
         Applies the unary transformation independently to two signals.
@@ -98,6 +135,8 @@ class Mixdown(UnaryTransform):
     For multi-channel signals (e.g., stereo), it computes the mean across
     the channels (typically the second axis for a 2D array like [samples, channels]).
     """
+    fusable = True
+
     def transform_unary(self, signal: Signal) -> Signal:
         """
         Applies the mixdown transformation.
@@ -115,7 +154,16 @@ class Mixdown(UnaryTransform):
         if chn <= 1:
             # Already mono
             return signal
-        return signal.mean(axis=1)
+        dtype = compute_dtype(signal)
+        if signal.shape[1] == 2:
+            # Stereo, by far the most common case: two strided elementwise
+            # passes are much faster than NumPy's generic reduction over a
+            # short axis.
+            out = signal[:, 0].astype(dtype)
+            out += signal[:, 1]
+            out *= dtype.type(0.5)
+            return out
+        return signal.mean(axis=1, dtype=dtype)
 
 
 class Normalize(UnaryTransform):
@@ -126,6 +174,8 @@ class Normalize(UnaryTransform):
     deviation is below a small epsilon value (to prevent division by zero
     or near-zero), the signal is transformed to all zeros.
     """
+    fusable = True
+
     def __init__(self, eps: float = 1e-10):
         """
         Initializes the Normalize transformer.
@@ -147,14 +197,42 @@ class Normalize(UnaryTransform):
         Returns:
             The normalized signal.
         """
-        std = np.std(signal)
+        # Work on a single fresh buffer in place instead of allocating
+        # temporaries for the subtraction and the division.
+        return self.transform_unary_inplace(signal.astype(compute_dtype(signal)))
+
+    def transform_unary_inplace(self, signal: Signal) -> Signal:
+        """
+        Applies Z-score normalization, overwriting the signal if possible.
+
+        Args:
+            signal: The input signal (NumPy array). Overwritten if it already
+                    has the dtype the computation is carried out in.
+
+        Returns:
+            The normalized signal.
+        """
+        if signal.dtype != compute_dtype(signal):
+            return self.transform_unary(signal)
+
+        out = signal
+        if out.size == 0:
+            return out
+        # Center first, then the standard deviation is the RMS of the centered
+        # signal: one reduction for the mean, a BLAS dot product for the
+        # variance, and no temporary array (unlike np.std).
+        out -= np.mean(out)
+        flat = out.reshape(-1)
+        std = np.sqrt(np.real(np.vdot(flat, flat)) / flat.size)
         if std < self.eps:
             # Signal is constant or near-constant.
             # Returning zeros is one way to handle this.
             # Another might be to return the signal as is if mean is also ~0,
             # or just signal - mean.
-            return signal * 0  # or raise warning
-        return (signal - np.mean(signal)) / std
+            out[...] = 0  # or raise warning
+            return out
+        out /= std
+        return out
 
 
 class LowPass(UnaryTransform):
@@ -171,6 +249,14 @@ class LowPass(UnaryTransform):
     time domain, one would typically apply an FFT, zero out high-frequency bins,
     and then apply an inverse FFT, or use a time-domain filter design.
     This class assumes the input `signal` is something like an FFT magnitude array.
+
+    The kept band depends on the spectrum layout: after `FFT` of a real
+    signal, the one-sided spectrum covers 0 Hz up to the Nyquist frequency,
+    so `keep_ratio` keeps that fraction of it (e.g. 0.1 keeps the lowest 10 %
+    of 0 to Nyquist). On a full two-sided spectrum, whose first half covers
+    0 Hz to Nyquist, the same ratio covers twice that fraction of the band
+    (e.g. 0.1 keeps the lowest 20 % of 0 to Nyquist); up to a ratio of 0.5,
+    no negative-frequency bins are kept.
     """
     def __init__(self, keep_ratio: float = 0.5):
         """
@@ -204,6 +290,8 @@ class Magnitude(UnaryTransform):
     This is often used after an FFT to get the magnitude spectrum from
     complex FFT coefficients.
     """
+    fusable = True
+
     def transform_unary(self, signal: Signal) -> Signal:
         """
         Calculates the absolute value of each element in the signal.
@@ -216,6 +304,139 @@ class Magnitude(UnaryTransform):
         """
         return np.abs(signal)
 
+    def transform_unary_inplace(self, signal: Signal) -> Signal:
+        """
+        Calculates the magnitudes, overwriting real-valued signals.
+
+        Args:
+            signal: The input signal. Overwritten if it is real-valued, as
+                    complex input needs a new (real) array anyway.
+
+        Returns:
+            A signal containing the magnitudes.
+        """
+        if np.iscomplexobj(signal):
+            return np.abs(signal)
+        return np.abs(signal, out=signal)
+
+
+class LowPassMagnitude(LowPass):
+    """
+    Computes the magnitudes of the components a low-pass filter keeps.
+
+    Equivalent to `Magnitude` followed by `LowPass`: as the magnitude is
+    taken element-wise, truncating first yields the same result, but the
+    magnitude is only computed for the kept components (e.g. a tenth of the
+    spectrum) instead of the whole signal.
+    """
+    def transform_unary(self, signal: Signal) -> Signal:
+        return np.abs(super().transform_unary(signal))
+
+    def transform_unary_inplace(self, signal: Signal) -> Signal:
+        return Magnitude().transform_unary_inplace(super().transform_unary(signal))
+
+
+class FusedTransform(UnaryTransform):
+    """
+    Applies a chain of fusable unary transformers as a single transformer.
+
+    Only the first transformer that produces a new array allocates; all
+    following ones overwrite that array (see `transform_unary_inplace`)
+    instead of materializing another intermediate, so the chain needs a
+    single working buffer per signal.
+    """
+    fusable = True
+
+    def __init__(self, steps: List[UnaryTransform]):
+        """
+        Initializes the FusedTransform.
+
+        Args:
+            steps: The fusable unary transformers to apply, in order.
+        """
+        self.steps = list(steps)
+
+    def transform_unary(self, signal: Signal) -> Signal:
+        """
+        Applies all transformers of the chain, leaving the input signal untouched.
+
+        Args:
+            signal: The input signal.
+
+        Returns:
+            The transformed signal.
+        """
+        out = signal
+        for step in self.steps:
+            # Steps may hand back (views of) their input, e.g. Mixdown for mono signals
+            if np.may_share_memory(out, signal):
+                out = step.transform_unary(out)
+            else:
+                out = step.transform_unary_inplace(out)
+        return out
+
+    def transform_unary_inplace(self, signal: Signal) -> Signal:
+        """
+        Applies all transformers of the chain, overwriting the signal if possible.
+
+        Args:
+            signal: The input signal. Its contents may be modified.
+
+        Returns:
+            The transformed signal, possibly sharing memory with `signal`.
+        """
+        for step in self.steps:
+            signal = step.transform_unary_inplace(signal)
+        return signal
+
+
+def fuse(steps: List[Transformer]) -> List[Transformer]:
+    """
+    Groups runs of adjacent fusable transformers into `FusedTransform`s.
+
+    Transformers that are not fusable (e.g. `PadZero`, `FFT` or `LowPass`)
+    break a run and are kept as they are, just like runs of a single
+    transformer. A `Magnitude` directly followed by a `LowPass` is replaced
+    by a `LowPassMagnitude`. Applying the result is equivalent to applying
+    `steps`.
+
+    Args:
+        steps: The transformers to apply, in order.
+
+    Returns:
+        The transformers with the fusable runs grouped.
+    """
+    rewritten: List[Transformer] = []
+    i = 0
+    while i < len(steps):
+        current = steps[i]
+        following = steps[i + 1] if i + 1 < len(steps) else None
+        # Exactly a LowPass, subclasses may filter differently
+        if (
+                isinstance(current, Magnitude) and isinstance(following, LowPass)
+                and type(following) is LowPass  # pylint: disable=unidiomatic-typecheck
+        ):
+            rewritten.append(LowPassMagnitude(keep_ratio=following.keep_ratio))
+            i += 2
+        else:
+            rewritten.append(current)
+            i += 1
+
+    fused: List[Transformer] = []
+    run: List[UnaryTransform] = []
+    for step in rewritten + [None]:
+        if isinstance(step, UnaryTransform) and step.fusable:
+            run.append(step)
+            continue
+        if len(run) > 1:
+            fused.append(FusedTransform(run))
+        else:
+            fused.extend(run)
+        run = []
+        if step is not None:
+            fused.append(step)
+    return fused
+
 
 class PadZero(BinaryTransform):
     """
@@ -240,17 +461,23 @@ class PadZero(BinaryTransform):
         if max_len == 0:  # Handle empty signals
             return signal_a, signal_b
 
-        # Calculate the next power of two
-        # (unless max_len is already a power of two)
-        if max_len & (max_len - 1) == 0 and max_len != 0:  # Check if power of two
-            n = max_len
-        else:
-            n = int(2 ** np.ceil(np.log2(max_len)))
+        # Next power of two (max_len itself if it already is one), in exact integer math
+        n = 1 << (max_len - 1).bit_length()
 
-        return (
-            np.pad(signal_a, (0, n - len(signal_a)), mode='constant', constant_values=0),
-            np.pad(signal_b, (0, n - len(signal_b)), mode='constant', constant_values=0)
-        )
+        return self._pad(signal_a, n), self._pad(signal_b, n)
+
+    @staticmethod
+    def _pad(signal: Signal, n: int) -> Signal:
+        """Pads a signal with trailing zeros to length `n`."""
+        if signal.ndim != 1:
+            return np.pad(signal, (0, n - len(signal)), mode='constant', constant_values=0)
+        if len(signal) == n:
+            return signal  # Nothing to pad, no need for a copy
+        # A single allocation: copy the samples, zero only the tail
+        out = np.empty(n, dtype=signal.dtype)
+        out[:len(signal)] = signal
+        out[len(signal):] = 0
+        return out
 
 
 class FFT(UnaryTransform):
@@ -259,6 +486,12 @@ class FFT(UnaryTransform):
 
     This transforms a time-domain signal into its frequency-domain representation.
     The result contains complex numbers representing magnitude and phase.
+
+    For real signals (such as audio) only the non-negative frequency half of
+    the spectrum is computed (`n // 2 + 1` bins), as the negative half is its
+    complex conjugate mirror. Complex signals get the full spectrum. A
+    following `LowPass` therefore keeps a ratio of 0 Hz to the Nyquist
+    frequency for real signals (see `LowPass`).
     """
     def transform_unary(self, signal: Signal) -> Signal:
         """
@@ -270,4 +503,6 @@ class FFT(UnaryTransform):
         Returns:
             The complex-valued frequency-domain representation of the signal.
         """
-        return fft(signal)
+        if np.isrealobj(signal):
+            return sp_fft.rfft(signal)
+        return sp_fft.fft(signal)
@@ -1,3 +1,7 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from sonitas.devices import AudioDevice
@@ -103,19 +107,42 @@ def test_audio_device_str_representation_input_output():
     assert str(device) == expected_str
 
 
-def test_audio_device_invalid_type_for_index():
-    """Test that Pydantic raises ValidationError for incorrect data types."""
-    invalid_data = VALID_DEVICE_DATA_INPUT_ONLY.copy()
-    invalid_data["index"] = "not_an_integer"  # Invalid type for index
+def test_audio_device_is_immutable():
+    """Test that an AudioDevice cannot be modified, so its cached summary stays valid."""
+    device = AudioDevice(**VALID_DEVICE_DATA_INPUT_ONLY)
+    summary = str(device)
+
+    with pytest.raises(FrozenInstanceError):
+        device.name = "Other"
+    assert str(device) == summary
+
+
+def test_audio_device_equality():
+    """Test that devices compare and hash by value, regardless of a cached summary."""
+    device_a = AudioDevice(**VALID_DEVICE_DATA_INPUT_ONLY)
+    device_b = AudioDevice(**VALID_DEVICE_DATA_INPUT_ONLY)
+    str(device_a)
+
+    assert device_a == device_b
+    assert hash(device_a) == hash(device_b)
+    assert device_a != AudioDevice(**VALID_DEVICE_DATA_OUTPUT_ONLY)
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, copy.deepcopy, lambda dev: pickle.loads(pickle.dumps(dev))])
+def test_audio_device_copy_and_pickle(duplicate):
+    """Test that an AudioDevice with a cached summary can be copied and pickled."""
+    device = AudioDevice(**VALID_DEVICE_DATA_INPUT_OUTPUT)
+    summary = str(device)
 
-    with pytest.raises(ValueError):  # Pydantic v1 raises ValidationError, v2 might raise ValueError for coercion
-        AudioDevice(**invalid_data)
+    duplicated = duplicate(device)
+    assert duplicated == device
+    assert str(duplicated) == summary
 
 
 def test_audio_device_missing_required_field():
-    """Test that Pydantic raises ValidationError if a required field is missing."""
+    """Test that a TypeError is raised if a required field is missing."""
     incomplete_data = VALID_DEVICE_DATA_INPUT_ONLY.copy()
     del incomplete_data["name"]  # Missing 'name'
 
-    with pytest.raises(ValueError):  # Pydantic v1 raises ValidationError, v2 might raise ValueError
+    with pytest.raises(TypeError):
         AudioDevice(**incomplete_data)
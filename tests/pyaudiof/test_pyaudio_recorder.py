@@ -0,0 +1,51 @@
+import pytest
+
+pyaudio = pytest.importorskip("pyaudio")
+
+from sonitas.devices import AudioDevice  # noqa: E402
+from sonitas.pyaudiof import PyAudioDeviceManager, PyAudioRecorder  # noqa: E402
+
+DEVICE = AudioDevice(index=0, name="Test Microphone", default_sample_rate=8000, max_input_channels=1,
+                     max_output_channels=0)
+
+
+class FakeStream:
+    """Stream that delivers silent chunks to the callback until it completes."""
+
+    def __init__(self, stream_callback, frames_per_buffer, channels, **_):
+        chunk = b'\x00\x00' * frames_per_buffer * channels
+        while stream_callback(chunk, frames_per_buffer, None, 0)[1] != pyaudio.paComplete:
+            pass
+
+    def is_active(self):
+        return False
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    def open(self, **kwargs):
+        return FakeStream(**kwargs)
+
+
+@pytest.fixture
+def recorder(monkeypatch) -> PyAudioRecorder:
+    """A recorder on a fake PyAudio instance with a single input device."""
+    monkeypatch.setattr(PyAudioDeviceManager, 'pa', property(lambda self: FakePyAudio()))
+    monkeypatch.setattr(PyAudioDeviceManager, 'select_default_input', lambda self: DEVICE)
+    rec = PyAudioRecorder()
+    yield rec
+    rec.close()
+
+
+@pytest.mark.parametrize("duration", [1, 0.5, 2.5])
+def test_pyaudio_recorder_duration(recorder: PyAudioRecorder, duration: float):
+    """Test recording whole and fractional durations."""
+    recording = recorder.record(duration)
+    assert recording.frame_rate == DEVICE.default_sample_rate
+    assert recording.channels == DEVICE.max_input_channels
+    assert recording.duration == pytest.approx(duration)
@@ -1,9 +1,12 @@
+import copy
+import pickle
 import pytest
 import numpy as np
+import struct
 import wave
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch, MagicMock
 
 from sonitas.recorder import Recording
 
@@ -27,13 +30,10 @@ BYTES_8BIT_STEREO = FRAMES_8BIT_STEREO_SAMPLES.tobytes()
 CHANNELS_STEREO = 2
 SAMPLE_SIZE_8BIT = 1
 
-# For testing signal() with sample_size=3 (maps to np.int32)
-# Frames must be multiple of 4 bytes for np.frombuffer(..., dtype=np.int32)
-# 2 samples, mono, int32 values: [1000000, -2000000]
-FRAMES_24BIT_AS_INT32_MONO_SAMPLES = np.array([1000000, -2000000], dtype=np.int32)
-BYTES_24BIT_AS_INT32_MONO = FRAMES_24BIT_AS_INT32_MONO_SAMPLES.tobytes()
-SAMPLE_SIZE_24BIT_EFFECTIVE_FOR_SIGNAL = 3  # This is what Recording stores
-# Note: len(BYTES_24BIT_AS_INT32_MONO) is 8 (2 samples * 4 bytes/int32)
+# 32-bit, mono, 4 samples
+FRAMES_32BIT_MONO_SAMPLES = np.array([1, 2, -3, 2 ** 31 - 1], dtype=np.int32)
+BYTES_32BIT_MONO = FRAMES_32BIT_MONO_SAMPLES.tobytes()
+SAMPLE_SIZE_32BIT = 4
 
 # For testing from_wav with actual 24-bit data (3 bytes per sample)
 # 2 samples, mono: [0x010203, 0x040506]
@@ -49,12 +49,15 @@ def create_dummy_wav_file(
         sample_width_bytes: int,
         frame_rate: int
 ):
-    """Helper to create a WAV file for testing."""
-    with wave.open(str(path), 'wb') as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(sample_width_bytes)
-        wf.setframerate(frame_rate)
-        wf.writeframes(frames_bytes)
+    """Helper to create a PCM WAV file for testing, written with a single call."""
+    block_align = channels * sample_width_bytes
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + len(frames_bytes), b'WAVE',
+        b'fmt ', 16, 1, channels, frame_rate, frame_rate * block_align, block_align, sample_width_bytes * 8,
+        b'data', len(frames_bytes),
+    )
+    path.write_bytes(header + frames_bytes)
 
 
 # --- Fixtures ---
@@ -80,6 +83,24 @@ def test_recording_instantiation(basic_recording: Recording):
     assert basic_recording.frame_rate == FRAME_RATE_CD
 
 
+def test_recording_is_immutable(basic_recording: Recording):
+    """Test that a Recording cannot be modified and does not show its frames in repr."""
+    with pytest.raises(FrozenInstanceError):
+        basic_recording.channels = CHANNELS_STEREO
+    assert repr(basic_recording) == (
+        f"Recording(channels={CHANNELS_MONO}, sample_size={SAMPLE_SIZE_16BIT}, frame_rate={FRAME_RATE_CD})"
+    )
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, copy.deepcopy, lambda rec: pickle.loads(pickle.dumps(rec))])
+def test_recording_copy_and_pickle(basic_recording: Recording, duplicate: Any):
+    """Test that a Recording with populated caches can be copied and pickled."""
+    basic_recording.signal()
+    duplicated = duplicate(basic_recording)
+    assert duplicated == basic_recording
+    np.testing.assert_array_equal(duplicated.signal(), FRAMES_16BIT_MONO_SAMPLES)
+
+
 def test_recording_summary(basic_recording: Recording):
     """Test the summary property."""
     expected_duration = len(BYTES_16BIT_MONO) / (CHANNELS_MONO * SAMPLE_SIZE_16BIT * FRAME_RATE_CD)
@@ -93,6 +114,19 @@ def test_recording_duration(basic_recording: Recording):
     assert basic_recording.duration == pytest.approx(expected_duration)
 
 
+def test_recording_nbytes_of_wide_buffer():
+    """Test nbytes and duration count bytes, not items, for buffers of wider items."""
+    recording = Recording(
+        frames=memoryview(FRAMES_16BIT_MONO_SAMPLES),
+        channels=CHANNELS_MONO,
+        sample_size=SAMPLE_SIZE_16BIT,
+        frame_rate=FRAME_RATE_CD,
+    )
+    assert recording.nbytes == len(BYTES_16BIT_MONO)
+    assert recording.summary.startswith(f"<length {len(BYTES_16BIT_MONO)};")
+    assert recording.duration == pytest.approx(len(FRAMES_16BIT_MONO_SAMPLES) / FRAME_RATE_CD)
+
+
 def test_recording_duration_zero_if_invalid_metadata():
     """Test duration returns 0.0 if metadata would cause division by zero."""
     rec_zero_channels = Recording(frames=b'abc', channels=0, sample_size=2, frame_rate=44100)
@@ -108,22 +142,17 @@ def test_recording_duration_zero_if_invalid_metadata():
 @pytest.mark.parametrize(
     "frames_bytes, channels, sample_size, expected_dtype, expected_array",
     [
-        # (BYTES_16BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_16BIT, np.int16, FRAMES_16BIT_MONO_SAMPLES.reshape(-1, 1)),
+        # Mono signals are 1D
+        (BYTES_16BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_16BIT, np.int16, FRAMES_16BIT_MONO_SAMPLES),
         (BYTES_8BIT_STEREO, CHANNELS_STEREO, SAMPLE_SIZE_8BIT, np.uint8, FRAMES_8BIT_STEREO_SAMPLES),
-        # (
-        #         np.array([1, 2, 3, 4], dtype=np.int32).tobytes(),  # 4-byte samples
-        #         CHANNELS_MONO,
-        #         4,  # sample_size = 4 bytes
-        #         np.int32,
-        #         np.array([1, 2, 3, 4], dtype=np.int32).reshape(-1, 1)
-        # ),
-        # (  # Test for sample_size=3, where frames are already suitable for int32
-        #         BYTES_24BIT_AS_INT32_MONO,
-        #         CHANNELS_MONO,
-        #         SAMPLE_SIZE_24BIT_EFFECTIVE_FOR_SIGNAL,  # sample_size = 3
-        #         np.int32,
-        #         FRAMES_24BIT_AS_INT32_MONO_SAMPLES.reshape(-1, 1)
-        # ),
+        (BYTES_32BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_32BIT, np.int32, FRAMES_32BIT_MONO_SAMPLES),
+        (  # Packed 24-bit samples, decoded into int32
+                BYTES_ACTUAL_24BIT_MONO_3BPS,
+                CHANNELS_MONO,
+                SAMPLE_SIZE_24BIT_ACTUAL,
+                np.int32,
+                np.array([0x010203, 0x040506], dtype=np.int32)
+        ),
     ],
 )
 def test_recording_signal_conversion(
@@ -138,7 +167,12 @@ def test_recording_signal_conversion(
     )
     signal_output = recording.signal()
     assert signal_output.dtype == expected_dtype
-    np.testing.assert_array_equal(signal_output, expected_array)
+    assert np.array_equal(signal_output, expected_array), (signal_output, expected_array)
+    if sample_size != SAMPLE_SIZE_24BIT_ACTUAL:
+        # Decoded without a copy, straight from the frames: a view whose
+        # memory is the frames buffer itself
+        assert signal_output.base is not None
+        assert np.shares_memory(signal_output, np.frombuffer(frames_bytes, dtype=np.uint8))
 
 
 def test_recording_signal_empty_frames():
@@ -149,6 +183,14 @@ def test_recording_signal_empty_frames():
     assert signal_output.dtype == np.int16  # Based on sample_size=2
 
 
+def test_recording_signal_empty_frames_multichannel():
+    """Test signal() with empty frames keeps the channel axis for multi-channel audio."""
+    recording = Recording(frames=b'', channels=CHANNELS_STEREO, sample_size=2, frame_rate=44100)
+    signal_output = recording.signal()
+    assert signal_output.shape == (0, CHANNELS_STEREO)
+    assert signal_output.dtype == np.int16
+
+
 def test_recording_signal_unsupported_sample_size():
     """Test signal() with an unsupported sample_size."""
     recording = Recording(frames=b'12345', channels=1, sample_size=5, frame_rate=44100)
@@ -156,23 +198,87 @@ def test_recording_signal_unsupported_sample_size():
         recording.signal()
 
 
-def test_recording_signal_frombuffer_error_for_true_24bit_frames():
-    """
-    Test signal() with sample_size=3 and frames from a true 24-bit source.
-    np.frombuffer(..., dtype=np.int32) will expect frame length to be a multiple of 4.
-    """
-    # BYTES_ACTUAL_24BIT_MONO_3BPS has length 6 (2 samples * 3 bytes/sample)
-    # np.int32 has itemsize 4. 6 is not a multiple of 4.
+def test_recording_signal_true_24bit_frames():
+    """Test signal() decodes packed 24-bit frames (3 bytes per sample) into int32 values."""
     recording = Recording(
         frames=BYTES_ACTUAL_24BIT_MONO_3BPS,
         channels=CHANNELS_MONO,
         sample_size=SAMPLE_SIZE_24BIT_ACTUAL,  # 3
         frame_rate=FRAME_RATE_CD
     )
-    with pytest.raises(ValueError, match="buffer size must be a multiple of element size"):
+    signal_output = recording.signal()
+    assert signal_output.dtype == np.int32
+    np.testing.assert_array_equal(signal_output, [0x010203, 0x040506])
+
+
+def test_recording_signal_24bit_sign_extension():
+    """Test signal() sign-extends negative 24-bit samples, also for multiple channels."""
+    samples = [-1, -0x800000, 0x7FFFFF, 0]
+    frames = b''.join(value.to_bytes(3, 'little', signed=True) for value in samples)
+    recording = Recording(frames=frames, channels=CHANNELS_STEREO, sample_size=3, frame_rate=FRAME_RATE_CD)
+    np.testing.assert_array_equal(recording.signal(), np.array(samples, dtype=np.int32).reshape(-1, 2))
+
+
+def test_recording_signal_24bit_incomplete_sample():
+    """Test signal() rejects 24-bit frames that do not consist of whole samples."""
+    recording = Recording(frames=b'\x01\x02\x03\x04', channels=1, sample_size=3, frame_rate=FRAME_RATE_CD)
+    with pytest.raises(ValueError, match="multiple of 3"):
         recording.signal()
 
 
+@pytest.mark.parametrize(
+    "frames_bytes, channels, sample_size, expected_array",
+    [
+        (BYTES_16BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_16BIT, FRAMES_16BIT_MONO_SAMPLES.reshape(1, -1)),
+        (BYTES_8BIT_STEREO, CHANNELS_STEREO, SAMPLE_SIZE_8BIT, FRAMES_8BIT_STEREO_SAMPLES.T),
+        (np.arange(6, dtype=np.int16).tobytes(), 3, SAMPLE_SIZE_16BIT, np.arange(6, dtype=np.int16).reshape(-1, 3).T),
+    ],
+)
+def test_recording_signal_deinterleaved(
+        frames_bytes: bytes, channels: int, sample_size: int, expected_array: np.ndarray
+):
+    """Test signal_deinterleaved() returns one contiguous row per channel."""
+    recording = Recording(
+        frames=frames_bytes, channels=channels, sample_size=sample_size, frame_rate=FRAME_RATE_CD
+    )
+    signal_output = recording.signal_deinterleaved()
+    assert signal_output.dtype == expected_array.dtype
+    assert signal_output.flags.c_contiguous
+    np.testing.assert_array_equal(signal_output, expected_array)
+
+
+@pytest.mark.parametrize(
+    "frames_bytes, channels, sample_size, expected_array",
+    [
+        (np.array([0, 1, -1, 32767, -32768], dtype=np.int16).tobytes(), CHANNELS_MONO, SAMPLE_SIZE_16BIT,
+         np.array([0.0, 2.0 ** -15, -2.0 ** -15, 1.0 - 2.0 ** -15, -1.0])),
+        (BYTES_8BIT_STEREO, CHANNELS_STEREO, SAMPLE_SIZE_8BIT, (FRAMES_8BIT_STEREO_SAMPLES - 128.0) / 128.0),
+        (BYTES_ACTUAL_24BIT_MONO_3BPS, CHANNELS_MONO, SAMPLE_SIZE_24BIT_ACTUAL,
+         np.array([0x010203, 0x040506]) / 2.0 ** 23),
+        (BYTES_32BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_32BIT, FRAMES_32BIT_MONO_SAMPLES / 2.0 ** 31),
+    ],
+)
+def test_recording_signal_f32(frames_bytes: bytes, channels: int, sample_size: int, expected_array: np.ndarray):
+    """Test signal_f32() scales the samples of every sample size into [-1.0, 1.0)."""
+    recording = Recording(
+        frames=frames_bytes, channels=channels, sample_size=sample_size, frame_rate=FRAME_RATE_CD
+    )
+    signal_output = recording.signal_f32()
+    assert signal_output.dtype == np.float32
+    assert np.abs(signal_output).max() <= 1.0
+    np.testing.assert_allclose(signal_output, expected_array, rtol=1e-7)
+
+
+def test_recording_signal_f32_round_trip():
+    """Test that scaling 16-bit float samples back reconstructs the original samples."""
+    samples = np.random.default_rng(19).integers(-32768, 32768, size=1000, dtype=np.int16)
+    recording = Recording(
+        frames=samples.tobytes(), channels=CHANNELS_MONO, sample_size=SAMPLE_SIZE_16BIT, frame_rate=FRAME_RATE_CD
+    )
+    restored = np.round(recording.signal_f32() * 32768.0).astype(np.int32)
+    assert np.abs(restored - samples).max() <= 1
+
+
 # --- Tests for from_wav() and to_wav() methods ---
 
 def test_recording_from_wav_and_to_wav_cycle(tmp_path: Path):
@@ -192,6 +298,11 @@ def test_recording_from_wav_and_to_wav_cycle(tmp_path: Path):
         original_frame_rate,
     )
 
+    # The hand-written header is a valid WAV file to the standard library, too
+    with wave.open(str(wav_path1), 'rb') as wf_original:
+        assert wf_original.getparams()[:3] == (original_channels, original_sample_size, original_frame_rate)
+        assert wf_original.readframes(wf_original.getnframes()) == original_frames
+
     # Load from WAV
     recording = Recording.from_wav(wav_path1)
     assert recording.frames == original_frames
@@ -229,14 +340,162 @@ def test_recording_from_wav_malformed_file(tmp_path: Path):
         Recording.from_wav(malformed_path)
 
 
-@patch('wave.open')
-def test_recording_from_wav_wave_error_on_open(mock_wave_open: MagicMock, tmp_path: Path):
-    """Test from_wav() when wave.open itself raises an error (e.g., permissions)."""
-    mock_wave_open.side_effect = wave.Error("Simulated wave open error")
-
-    # Create a dummy file that exists, so FileNotFoundError is not the cause
+def test_recording_from_wav_empty_file(tmp_path: Path):
+    """Test from_wav() with an existing but empty file."""
     dummy_path = tmp_path / "dummy.wav"
     dummy_path.touch()
 
-    with pytest.raises(wave.Error, match="Simulated wave open error"):
+    with pytest.raises(wave.Error, match="RIFF"):
+        Recording.from_wav(dummy_path)
+
+
+def test_recording_from_wav_bad_magic(tmp_path: Path):
+    """Test from_wav() with a file of WAV size whose header does not start with RIFF."""
+    dummy_path = tmp_path / "dummy.wav"
+    dummy_path.write_bytes(b'NOT_A_RIFF' + b'\0' * 32)
+
+    with pytest.raises(wave.Error, match="RIFF"):
         Recording.from_wav(dummy_path)
+
+
+def test_recording_from_wav_skips_extra_chunks(tmp_path: Path):
+    """Test from_wav() with an extended fmt chunk and a LIST chunk before the data."""
+    fmt = struct.pack(
+        '<HHIIHHH', 1, CHANNELS_MONO, FRAME_RATE_CD,
+        FRAME_RATE_CD * SAMPLE_SIZE_16BIT, SAMPLE_SIZE_16BIT, SAMPLE_SIZE_16BIT * 8, 0
+    )
+    info = b'INFOISFT\x03\x00\x00\x00ab\x00'  # Odd sized, requires a pad byte
+    body = (
+        b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'LIST' + struct.pack('<I', len(info)) + info + b'\x00'
+        + b'data' + struct.pack('<I', len(BYTES_16BIT_MONO)) + BYTES_16BIT_MONO
+    )
+    wav_path = tmp_path / "extended.wav"
+    wav_path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+
+    recording = Recording.from_wav(wav_path)
+    assert recording.frames == BYTES_16BIT_MONO
+    assert recording.channels == CHANNELS_MONO
+    assert recording.sample_size == SAMPLE_SIZE_16BIT
+    assert recording.frame_rate == FRAME_RATE_CD
+
+
+def _write_extensible_wav(path: Path, sub_format: bytes) -> None:
+    """Writes BYTES_16BIT_MONO as a WAVE_FORMAT_EXTENSIBLE file with the given SubFormat GUID."""
+    fmt = struct.pack(
+        '<HHIIHHHHI16s', 0xFFFE, CHANNELS_MONO, FRAME_RATE_CD, FRAME_RATE_CD * SAMPLE_SIZE_16BIT,
+        SAMPLE_SIZE_16BIT, SAMPLE_SIZE_16BIT * 8, 22, SAMPLE_SIZE_16BIT * 8, 0x4, sub_format
+    )
+    body = (
+        b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'data' + struct.pack('<I', len(BYTES_16BIT_MONO)) + BYTES_16BIT_MONO
+    )
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+
+
+# SubFormat GUIDs: the format tag followed by a fixed suffix
+GUID_SUFFIX = b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+
+def test_recording_from_wav_extensible_pcm(tmp_path: Path):
+    """Test from_wav() with an extensible fmt chunk whose SubFormat is integer PCM."""
+    wav_path = tmp_path / "extensible.wav"
+    _write_extensible_wav(wav_path, b'\x01\x00' + GUID_SUFFIX)
+
+    recording = Recording.from_wav(wav_path)
+    assert recording.frames == BYTES_16BIT_MONO
+    assert recording.sample_size == SAMPLE_SIZE_16BIT
+
+
+def test_recording_from_wav_extensible_float(tmp_path: Path):
+    """Test from_wav() rejects an extensible fmt chunk with IEEE float samples."""
+    wav_path = tmp_path / "extensible_float.wav"
+    _write_extensible_wav(wav_path, b'\x03\x00' + GUID_SUFFIX)
+
+    with pytest.raises(wave.Error, match="unknown extended format"):
+        Recording.from_wav(wav_path)
+
+
+def test_recording_from_wavs(tmp_path: Path):
+    """Test from_wavs() loads several files in the given order."""
+    wav_path1 = tmp_path / "mono.wav"
+    wav_path2 = tmp_path / "stereo.wav"
+    create_dummy_wav_file(wav_path1, BYTES_16BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_16BIT, FRAME_RATE_CD)
+    create_dummy_wav_file(wav_path2, BYTES_8BIT_STEREO, CHANNELS_STEREO, SAMPLE_SIZE_8BIT, FRAME_RATE_CD)
+
+    recording1, recording2, recording3 = Recording.from_wavs([wav_path1, str(wav_path2), wav_path1])
+    assert recording1 == Recording.from_wav(wav_path1)
+    assert recording2 == Recording.from_wav(wav_path2)
+    assert recording3 == recording1
+
+
+def test_recording_from_wavs_file_not_found(tmp_path: Path):
+    """Test from_wavs() propagates errors of individual files."""
+    wav_path = tmp_path / "test.wav"
+    create_dummy_wav_file(wav_path, BYTES_16BIT_MONO, CHANNELS_MONO, SAMPLE_SIZE_16BIT, FRAME_RATE_CD)
+    with pytest.raises(FileNotFoundError):
+        Recording.from_wavs([wav_path, tmp_path / "non_existent.wav"])
+
+
+@pytest.mark.parametrize(
+    "frames",
+    [
+        bytearray(BYTES_8BIT_STEREO),
+        memoryview(BYTES_8BIT_STEREO),
+        memoryview(FRAMES_8BIT_STEREO_SAMPLES),  # 2D buffer
+    ],
+)
+def test_recording_signal_bytes_like_frames(frames: Any):
+    """Test signal() decodes any bytes-like frames through the buffer protocol."""
+    recording = Recording(
+        frames=frames, channels=CHANNELS_STEREO, sample_size=SAMPLE_SIZE_8BIT, frame_rate=FRAME_RATE_CD
+    )
+    np.testing.assert_array_equal(recording.signal(), FRAMES_8BIT_STEREO_SAMPLES)
+
+
+def test_recording_signal_frames_without_buffer():
+    """Test signal() rejects frames that do not expose a buffer instead of iterating them."""
+    recording = Recording(frames=[1, 2], channels=CHANNELS_MONO, sample_size=SAMPLE_SIZE_8BIT, frame_rate=FRAME_RATE_CD)
+    with pytest.raises(TypeError):
+        recording.signal()
+
+
+def test_recording_signal_is_cached(basic_recording: Recording):
+    """Test signal() builds the array once and hands it out read-only."""
+    signal_output = basic_recording.signal()
+    assert basic_recording.signal() is signal_output
+    assert not signal_output.flags.writeable
+    assert basic_recording == Recording(
+        frames=BYTES_16BIT_MONO, channels=CHANNELS_MONO, sample_size=SAMPLE_SIZE_16BIT, frame_rate=FRAME_RATE_CD
+    )
+
+
+@pytest.mark.parametrize(
+    "frames_bytes, channels, sample_size",
+    [
+        (BYTES_8BIT_STEREO + b'\x05\x06', CHANNELS_STEREO, SAMPLE_SIZE_8BIT),
+        (BYTES_ACTUAL_24BIT_MONO_3BPS[:3], CHANNELS_MONO, SAMPLE_SIZE_24BIT_ACTUAL),  # Odd size, needs a pad byte
+        (b'', CHANNELS_MONO, SAMPLE_SIZE_16BIT),
+    ],
+)
+def test_recording_to_wav_is_readable_by_wave(tmp_path: Path, frames_bytes: bytes, channels: int, sample_size: int):
+    """Test to_wav() writes files the wave module and from_wav() read back identically."""
+    recording = Recording(frames=frames_bytes, channels=channels, sample_size=sample_size, frame_rate=FRAME_RATE_CD)
+    wav_path = tmp_path / "out.wav"
+    recording.to_wav(wav_path)
+
+    with wave.open(str(wav_path), 'rb') as wf:
+        assert wf.getnchannels() == channels
+        assert wf.getsampwidth() == sample_size
+        assert wf.getframerate() == FRAME_RATE_CD
+        assert wf.readframes(wf.getnframes()) == frames_bytes
+    assert Recording.from_wav(wav_path) == recording
+
+
+def test_recording_to_wav_invalid_metadata(tmp_path: Path):
+    """Test to_wav() rejects metadata a PCM WAV file cannot hold."""
+    recording = Recording(frames=b'12345', channels=1, sample_size=5, frame_rate=FRAME_RATE_CD)
+    with pytest.raises(wave.Error, match="sample width"):
+        recording.to_wav(tmp_path / "out.wav")
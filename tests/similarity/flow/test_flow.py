@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from sonitas.similarity import transform
+from sonitas.similarity.flow import Flow
+from sonitas.similarity.scoring import CosineScoring, PearsonScoring
+
+
+def default_steps(lowpass: float):
+    """The default spectrum comparison steps of the CLI."""
+    return [
+        transform.Mixdown(),
+        transform.Normalize(),
+        transform.PadZero(),
+        transform.FFT(),
+        transform.Magnitude(),
+        transform.LowPass(keep_ratio=lowpass),
+    ]
+
+
+@pytest.fixture
+def signals():
+    """A mono and a stereo int16 signal of different lengths."""
+    rng = np.random.default_rng(42)
+    signal_a = rng.integers(-2000, 2000, size=1000).astype(np.int16)
+    signal_b = rng.integers(-2000, 2000, size=(700, 2)).astype(np.int16)
+    return signal_a, signal_b
+
+
+@pytest.mark.parametrize("lowpass", [0.0001, 0.1, 0.5, 1.0])
+@pytest.mark.parametrize("scoring", [CosineScoring, PearsonScoring])
+def test_flow_run_default_steps_matches_unfused(signals, lowpass, scoring):
+    """Test that the fused plan of the default steps scores like applying the steps one by one."""
+    signal_a, signal_b = signals
+    expected_a, expected_b = signal_a, signal_b
+    for step in default_steps(lowpass):
+        expected_a, expected_b = step.transform(expected_a, expected_b)
+
+    score = Flow(default_steps(lowpass), scoring()).run(signal_a, signal_b)
+
+    assert score == pytest.approx(scoring().compare(expected_a, expected_b))
+
+
+@pytest.mark.parametrize("scoring", [CosineScoring, PearsonScoring])
+def test_flow_run_same_signal_transforms_once(signals, scoring, monkeypatch):
+    """Test that a signal compared with itself is transformed once and scored like an equal copy."""
+    signal_a, _ = signals
+    flow = Flow(default_steps(0.1), scoring())
+    expected = flow.run(signal_a, signal_a.copy())
+    calls = []
+    fft = transform.FFT.transform_unary
+    monkeypatch.setattr(transform.FFT, 'transform_unary', lambda self, sig: calls.append(1) or fft(self, sig))
+
+    assert flow.run(signal_a, signal_a) == pytest.approx(expected)
+    assert len(calls) == 1
+
+    silent = np.zeros(64, dtype=np.int16)
+    assert flow.run(silent, silent) == flow.run(silent, silent.copy())
+
+
+def test_flow_run_does_not_modify_inputs():
+    """Test that steps working in place on intermediates leave the inputs untouched."""
+    signal_a = np.array([[1.0, 3.0], [-2.0, 0.0], [4.0, -4.0], [0.5, 0.5]])
+    signal_b = np.array([-1.0, 2.0, -3.0, 4.0])
+    copy_a, copy_b = signal_a.copy(), signal_b.copy()
+    steps = [transform.Mixdown(), transform.Normalize(), transform.Magnitude(), transform.Normalize()]
+
+    score = Flow(steps, CosineScoring()).run(signal_a, signal_b)
+
+    np.testing.assert_array_equal(signal_a, copy_a)
+    np.testing.assert_array_equal(signal_b, copy_b)
+    expected_a, expected_b = copy_a.mean(axis=1), copy_b
+    for step in steps:
+        expected_a, expected_b = step.transform_unary(expected_a), step.transform_unary(expected_b)
+    assert score == pytest.approx(CosineScoring().compare(expected_a, expected_b))
+
+
+def test_fuse_groups_adjacent_fusable_steps():
+    """Test that runs of sample-wise steps are grouped, other steps break them and low-pass merges."""
+    steps = default_steps(0.5) + [transform.Normalize()]
+    fused = transform.fuse(steps)
+
+    assert [type(step) for step in fused] == [
+        transform.FusedTransform, transform.PadZero, transform.FFT, transform.LowPassMagnitude, transform.Normalize
+    ]
+    assert fused[0].steps == steps[:2]
+    assert fused[3].keep_ratio == 0.5
+
+
+def test_fused_transform_matches_steps():
+    """Test that a fused chain yields the same result as its steps and keeps the input."""
+    signal = np.array([[1, 3], [-2, 0], [4, -4], [1, 1]], dtype=np.int16)
+    copy = signal.copy()
+    steps = [transform.Mixdown(), transform.Normalize(), transform.Magnitude()]
+
+    result = transform.FusedTransform(steps).transform_unary(signal)
+
+    np.testing.assert_array_equal(signal, copy)
+    expected = signal
+    for step in steps:
+        expected = step.transform_unary(expected)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_flow_run_batch_matches_run(signals, workers):
+    """Test that batch evaluation yields the scores of individual runs, in order."""
+    signal_a, signal_b = signals
+    pairs = [(signal_a, signal_b), (signal_b, signal_a), (signal_a, signal_a[::-1])]
+    flow = Flow(default_steps(0.1), CosineScoring())
+
+    scores = flow.run_batch(pairs, workers=workers)
+
+    assert scores == pytest.approx([flow.run(a, b) for a, b in pairs])
@@ -1,9 +1,14 @@
+import math
+
 import numpy as np
 import pytest
 
 from sonitas.similarity.scoring import CosineScoring
 from sonitas.typestore import Signal
 
+# Cosine similarity of [1, 2, 3] and [1, 3, 5]: 22 / (sqrt(14) * sqrt(35))
+SIMILARITY_123_135 = 22.0 / math.sqrt(490.0)
+
 
 # Fixture for the CosineScoring instance
 @pytest.fixture
@@ -43,8 +48,7 @@ def test_cosine_some_similarity(cosine_scorer: CosineScoring):
     # norm_a = sqrt(1^2 + 2^2 + 3^2) = sqrt(1 + 4 + 9) = sqrt(14)
     # norm_b = sqrt(1^2 + 3^2 + 5^2) = sqrt(1 + 9 + 25) = sqrt(35)
     # expected = 22 / (sqrt(14) * sqrt(35)) = 22 / sqrt(490) = 22 / 22.1359... approx 0.9938...
-    expected_similarity = 22 / (np.linalg.norm(signal_a) * np.linalg.norm(signal_b))
-    assert cosine_scorer.compare(signal_a, signal_b) == pytest.approx(expected_similarity)
+    assert cosine_scorer.compare(signal_a, signal_b) == pytest.approx(SIMILARITY_123_135)
 
 
 def test_cosine_one_zero_vector(cosine_scorer: CosineScoring):
@@ -96,3 +100,46 @@ def test_cosine_single_element_vectors(cosine_scorer: CosineScoring):
     signal_e: Signal = np.array([0])
     signal_f: Signal = np.array([10])
     assert cosine_scorer.compare(signal_e, signal_f) == 0.0 # One is zero
+
+
+def test_cosine_complex_vectors(cosine_scorer: CosineScoring):
+    """Test cosine similarity with complex vectors (e.g. a raw FFT spectrum)."""
+    signal_a: Signal = np.array([1 + 2j, 3 - 1j, -2j])
+    assert cosine_scorer.compare(signal_a, signal_a) == pytest.approx(1.0)
+    assert cosine_scorer.compare(signal_a, -signal_a) == pytest.approx(-1.0)
+    assert cosine_scorer.compare(signal_a, 1j * signal_a) == pytest.approx(0.0)
+
+
+def test_cosine_compare_batch(cosine_scorer: CosineScoring):
+    """Test batch scoring against the pairwise scores, including a zero reference."""
+    signal: Signal = np.array([1, 2, 3])
+    references: Signal = np.array([[1, 2, 3], [-1, -2, -3], [1, 3, 5], [0, 0, 0], [3, 0, -1]])
+    expected = [cosine_scorer.compare(signal, reference) for reference in references]
+    np.testing.assert_allclose(cosine_scorer.compare_batch(signal, references), expected)
+
+
+def test_cosine_compare_batch_precomputed_norms(cosine_scorer: CosineScoring):
+    """Test batch scoring of a (K, D) library with norms computed once up front."""
+    rng = np.random.default_rng(6)
+    library: Signal = rng.normal(size=(8, 32))
+    norms = cosine_scorer.norms(library)
+
+    for _ in range(2):
+        query: Signal = rng.normal(size=32)
+        expected = [cosine_scorer.compare(query, reference) for reference in library]
+        np.testing.assert_allclose(
+            cosine_scorer.compare_batch(query, library, reference_norms=norms), expected, rtol=1e-5, atol=1e-6
+        )
+
+
+def test_cosine_read_only_view_of_changed_base(cosine_scorer: CosineScoring):
+    """Test that a read-only view is scored by its current values after its base changed."""
+    base = np.arange(100.0) + 1
+    view: Signal = base.view()
+    view.flags.writeable = False
+    other: Signal = np.ones(100)
+    cosine_scorer.compare(view, other)
+
+    base[:50] *= 10
+    expected = np.dot(base, other) / (np.linalg.norm(base) * np.linalg.norm(other))
+    assert cosine_scorer.compare(view, other) == pytest.approx(expected, rel=1e-6)
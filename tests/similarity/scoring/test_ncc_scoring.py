@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from sonitas.similarity.scoring import NCCScoring
+
+
+def reference_ncc(signal_a: np.ndarray, signal_b: np.ndarray) -> float:
+    """Z-normalizes both signals and correlates them at lag 0."""
+    return np.correlate(
+        (signal_a - np.mean(signal_a)) / np.std(signal_a),
+        (signal_b - np.mean(signal_b)) / np.std(signal_b),
+        mode='valid'
+    )[0].real / len(signal_a)
+
+
+@pytest.mark.parametrize("length_b", [500, 400])
+def test_ncc_matches_reference(length_b: int):
+    """Test NCC against the z-normalized correlation, for equal and unequal lengths."""
+    rng = np.random.default_rng(7)
+    signal_a = rng.normal(size=500)
+    signal_b = signal_a[:length_b] + rng.normal(scale=0.5, size=length_b)
+    assert NCCScoring().compare(signal_a, signal_b) == pytest.approx(reference_ncc(signal_a, signal_b))
+
+
+def test_ncc_integer_and_complex_signals():
+    """Test NCC on integer signals and on complex signals."""
+    signal_a = np.array([1, 5, 2, 8, 3], dtype=np.int16)
+    signal_b = np.array([2, 4, 1, 9, 4], dtype=np.int16)
+    assert NCCScoring().compare(signal_a, signal_b) == pytest.approx(
+        reference_ncc(signal_a.astype(float), signal_b.astype(float))
+    )
+
+    spectrum = np.fft.fft(signal_a.astype(float))
+    assert NCCScoring().compare(spectrum, spectrum) == pytest.approx(1.0)
+
+
+def test_ncc_constant_signal():
+    """Test NCC returns 0.0 instead of NaN when a signal has no variance."""
+    assert NCCScoring().compare(np.full(4, 3.0), np.array([1.0, 2.0, 3.0, 4.0])) == 0.0
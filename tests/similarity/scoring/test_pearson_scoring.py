@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from scipy.stats import pearsonr
+
+from sonitas.similarity.scoring import PearsonScoring
+from sonitas.typestore import Signal
+
+
+@pytest.fixture
+def pearson_scorer() -> PearsonScoring:
+    """Returns an instance of PearsonScoring."""
+    return PearsonScoring()
+
+
+def test_pearson_matches_scipy(pearson_scorer: PearsonScoring):
+    """Test Pearson correlation against the SciPy reference implementation."""
+    rng = np.random.default_rng(0)
+    signal_a: Signal = rng.normal(size=500)
+    signal_b: Signal = 0.5 * signal_a + rng.normal(size=500)
+    expected, _ = pearsonr(signal_a, signal_b)
+    assert pearson_scorer.compare(signal_a, signal_b) == pytest.approx(expected)
+
+
+def test_pearson_integer_signals(pearson_scorer: PearsonScoring):
+    """Test Pearson correlation with integer signals (e.g. raw PCM samples)."""
+    signal_a: Signal = np.array([1, 2, 3, 4], dtype=np.int16)
+    signal_b: Signal = np.array([2, 4, 6, 8], dtype=np.int16)
+    assert pearson_scorer.compare(signal_a, signal_b) == pytest.approx(1.0)
+    assert pearson_scorer.compare(signal_a, -signal_b) == pytest.approx(-1.0)
+
+
+def test_pearson_constant_signals(pearson_scorer: PearsonScoring):
+    """Test Pearson correlation when signals have zero variance."""
+    constant: Signal = np.array([3, 3, 3])
+    assert pearson_scorer.compare(constant, constant) == 1.0
+    assert pearson_scorer.compare(constant, np.array([4, 4, 4])) == 0.0
+    assert pearson_scorer.compare(constant, np.array([1, 2, 3])) == 0.0
+
+
+def test_pearson_compare_batch(pearson_scorer: PearsonScoring):
+    """Test batch scoring against the pairwise scores, including constant signals."""
+    rng = np.random.default_rng(1)
+    signal: Signal = rng.normal(size=50)
+    references: Signal = np.vstack([signal * 2, -signal, rng.normal(size=(3, 50)), np.full(50, 2.0)])
+    expected = [pearson_scorer.compare(signal, reference) for reference in references]
+    # Single precision: a matrix-vector product rounds differently than separate dot products
+    np.testing.assert_allclose(pearson_scorer.compare_batch(signal, references), expected, rtol=1e-6)
+
+    constant: Signal = np.array([3, 3, 3])
+    references = np.array([[3, 3, 3], [4, 4, 4], [1, 2, 3]])
+    np.testing.assert_array_equal(pearson_scorer.compare_batch(constant, references), [1.0, 0.0, 0.0])
+
+
+def test_pearson_dtype():
+    """Test that the comparison precision is configurable and must be a float type."""
+    rng = np.random.default_rng(2)
+    signal_a: Signal = rng.normal(size=100)
+    signal_b: Signal = signal_a + rng.normal(size=100)
+    expected, _ = pearsonr(signal_a, signal_b)
+    assert PearsonScoring(dtype=np.float64).compare(signal_a, signal_b) == pytest.approx(expected, rel=1e-12)
+    with pytest.raises(ValueError, match="floating point"):
+        PearsonScoring(dtype=np.int16)
+
+
+@pytest.mark.parametrize(
+    "scale, offset",
+    [
+        (2.0 ** 28, 0.0),  # Raw 32-bit PCM range
+        (1e12, 0.0),  # Large spectrum magnitudes
+        (1e-14, 0.0),  # Tiny magnitudes
+        (1.0, 1e6),  # Large DC offset
+    ],
+)
+def test_pearson_extreme_magnitudes(pearson_scorer: PearsonScoring, scale: float, offset: float):
+    """Test that single precision scoring neither overflows nor underflows, nor loses an offset signal."""
+    rng = np.random.default_rng(3)
+    base_a = rng.normal(size=1000)
+    base_b = base_a + 0.5 * rng.normal(size=1000)
+    expected, _ = pearsonr(base_a, base_b)
+    signal_a: Signal = base_a * scale + offset
+    signal_b: Signal = base_b * scale + offset
+
+    with np.errstate(all='raise'):
+        assert pearson_scorer.compare(signal_a, signal_b) == pytest.approx(expected, rel=1e-5)
+        batch = pearson_scorer.compare_batch(signal_a, np.vstack([signal_b, signal_a]))
+    np.testing.assert_allclose(batch, [expected, 1.0], rtol=1e-5)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from scipy.stats import spearmanr
+
+from sonitas.similarity.scoring import SpearmanScoring
+from sonitas.typestore import Signal
+
+
+@pytest.fixture
+def spearman_scorer() -> SpearmanScoring:
+    """Returns an instance of SpearmanScoring."""
+    return SpearmanScoring()
+
+
+def test_spearman_matches_scipy(spearman_scorer: SpearmanScoring):
+    """Test Spearman correlation against the SciPy reference implementation, with ties."""
+    rng = np.random.default_rng(3)
+    signal_a: Signal = rng.integers(0, 20, size=300)
+    signal_b: Signal = signal_a + rng.integers(-10, 10, size=300)
+    expected, _ = spearmanr(signal_a, signal_b)
+    assert spearman_scorer.compare(signal_a, signal_b) == pytest.approx(expected)
+
+
+def test_spearman_prepared_ranks(spearman_scorer: SpearmanScoring):
+    """Test that comparing prepared ranks yields the same scores, also in batches."""
+    rng = np.random.default_rng(4)
+    signal: Signal = rng.normal(size=100)
+    references: Signal = np.vstack([signal ** 3, -signal, rng.normal(size=(3, 100))])
+    expected = [spearman_scorer.compare(signal, reference) for reference in references]
+
+    ranks = spearman_scorer.prepare(signal)
+    assert [spearman_scorer.compare_ranks(ranks, spearman_scorer.prepare(r)) for r in references] == expected
+    np.testing.assert_allclose(spearman_scorer.compare_batch(signal, references), expected)
+    assert expected[0] == pytest.approx(1.0)
+    assert expected[1] == pytest.approx(-1.0)
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from sonitas.similarity.transform import Mixdown
+
+
+@pytest.mark.parametrize("channels", [2, 3])
+@pytest.mark.parametrize("dtype", [np.int16, np.uint8, np.float64])
+def test_mixdown_matches_channel_mean(channels, dtype):
+    """Test that mixdown averages the channels, for the stereo fast path and the generic case."""
+    rng = np.random.default_rng(5)
+    signal = rng.integers(0, 200, size=(50, channels)).astype(dtype)
+    expected_dtype = np.float64 if dtype == np.float64 else np.float32
+
+    mono = Mixdown().transform_unary(signal)
+
+    assert mono.dtype == expected_dtype
+    np.testing.assert_allclose(mono, signal.astype(np.float64).mean(axis=1), rtol=1e-6)
+
+
+def test_mixdown_mono_unchanged():
+    """Test that a mono signal is returned as is."""
+    signal = np.arange(4, dtype=np.int16)
+    assert Mixdown().transform_unary(signal) is signal